@@ -0,0 +1,53 @@
+from time import perf_counter
+from numpy import square, median, seterr
+from numpy.random import default_rng
+from numpy.polynomial.legendre import legval2d
+from lpde.geometry import WidthOf, Window, PointAt, BoundingBox, Mapper, Grid
+from lpde.estimators import ParallelEstimator
+from lpde.estimators.datatypes import Degree, Scalings
+from lpde.producers import MockParams
+from lpde.producers.distributions import gaussian
+
+GRIDS = ((150, 100), (800, 500), (3000, 2000))
+DEGREE = Degree(20, 20)
+REPETITIONS: int = 5
+BASELINE_REPETITIONS: int = 1  # The baseline takes seconds on large grids.
+SEED: int = 42
+
+
+def frame_times(estimator: ParallelEstimator, grid: Grid) -> (float, float):
+    estimator.grid = grid
+    x_grid, y_grid = estimator.grid
+    coeffs = estimator.snapshot.coeffs.reshape(DEGREE.k_max + 1,
+                                               DEGREE.l_max + 1)
+    coeffs = coeffs / Scalings(DEGREE).mat
+    legval_times, gemm_times = [], []
+    for _ in range(BASELINE_REPETITIONS):
+        start = perf_counter()
+        _ = square(legval2d(x_grid, y_grid, coeffs))
+        legval_times.append(perf_counter() - start)
+    for _ in range(REPETITIONS):
+        start = perf_counter()
+        _ = estimator.on_grid
+        gemm_times.append(perf_counter() - start)
+    return median(legval_times), median(gemm_times)
+
+
+if __name__ == '__main__':
+    _ = seterr(over='ignore')
+    bounds = BoundingBox(PointAt(51.375, 35.675), Window(0.55, 0.35))
+    mapper = Mapper(bounds, WidthOf(1.8))
+    params = MockParams(30, 1000, gaussian)
+    estimator = ParallelEstimator(DEGREE, mapper, params)
+    n_coeffs = estimator.snapshot.coeffs.size
+    coefficients = default_rng(SEED).normal(size=n_coeffs)
+    coefficients /= coefficients.dot(coefficients)**0.5
+    estimator.controller.publication.publish(coefficients, 1000)
+    print(f'Frame evaluation time at degree {DEGREE.k_max}x{DEGREE.l_max}:')
+    print(f'{"grid (y x x)":>14} {"legval2d":>12}'
+          f' {"GEMM":>12} {"speed-up":>9}')
+    for x, y in GRIDS:
+        legval_time, gemm_time = frame_times(estimator, Grid(x, y))
+        print(f'{f"{y}x{x}":>14} {legval_time*1e3:>10.2f}ms'
+              f' {gemm_time*1e3:>10.2f}ms {legval_time/gemm_time:>8.1f}x')
+    estimator.controller.stop()
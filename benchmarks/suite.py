@@ -0,0 +1,243 @@
+from argparse import ArgumentParser
+from json import dump, load
+from multiprocessing import Pipe, Queue
+from os import remove, close
+from platform import python_version
+from sys import exit
+from tempfile import mkstemp
+from threading import Thread
+from time import perf_counter, sleep, time
+from uuid import UUID
+from numpy import median, seterr, zeros, frombuffer, uint8, save
+from numpy import __version__
+from numpy.random import default_rng
+from lpde.geometry import WidthOf, Window, PointAt, BoundingBox, Mapper, Grid
+from lpde.estimators import ParallelEstimator, SerialEstimator
+from lpde.estimators.analytics import l2_distance
+from lpde.estimators.datatypes import Degree, Event, Action, Positions
+from lpde.estimators.datatypes import EVENT_RECORD
+from lpde.estimators.parallel.datagate import DataGateParams, DataGate
+from lpde.estimators.parallel.minimizer import MinimizerParams, Minimizer
+from lpde.estimators.parallel.publication import Publication
+from lpde.producers import MockParams, ReplayParams
+from lpde.producers.distributions import gaussian
+from lpde.producers.workloads import Gaussian, Mixture, Uniform
+
+SEED: int = 42
+BOUNDS = BoundingBox(PointAt(51.375, 35.675), Window(0.55, 0.35))
+MAPPER = Mapper(BOUNDS, WidthOf(1.8))
+WORKLOAD = Mixture([Gaussian((-0.2, -0.1), (0.08, 0.1)),
+                    Gaussian((0.25, 0.2), (0.05, 0.05)),
+                    Uniform()], [0.5, 0.3, 0.2])
+REPETITIONS: int = 5
+QUERY_REPETITIONS: int = 25  # Queries take well under a millisecond.
+BATCH_SIZE: int = 100  # Events per message sent to the DataGate.
+TOLERANCE: float = 0.2  # Relative change flagged as regression.
+SETTLED: float = 1e-4  # L2 change between snapshots deemed settled.
+SETTLE_TIMEOUT: float = 60.0
+
+
+def seeded_events(n: int, seed: int =SEED) -> list:
+    rng = default_rng(seed)
+    xy = WORKLOAD.draw(BOUNDS, n, rng, 0.0)
+    return [Event(UUID(bytes=rng.bytes(16), version=4), Action.ADD,
+                  PointAt(x, y)) for x, y in xy]
+
+
+def datagate_throughput(n_events: int) -> float:
+    publication = Publication(Degree(1, 1), MAPPER)
+    event_pipe_out, event_pipe_in = Pipe(duplex=False)
+    point_queue = Queue()
+    params = DataGateParams(Degree(1, 1), MAPPER, event_pipe_out,
+                            point_queue, publication)
+    datagate = DataGate(params)
+    datagate.start()
+    draining = Thread(target=drain, args=(point_queue, datagate),
+                      daemon=True)
+    draining.start()
+    events = seeded_events(n_events)
+    start = perf_counter()
+    for offset in range(0, n_events, BATCH_SIZE):
+        event_pipe_in.send(events[offset:offset + BATCH_SIZE])
+    while datagate.N < n_events:
+        sleep(0.001)
+    elapsed = perf_counter() - start
+    datagate.flag.stop.set()
+    datagate.flag.done.wait()
+    datagate.join()
+    publication.unlink()
+    return n_events / elapsed
+
+
+def drain(queue: Queue, process) -> None:
+    while not process.flag.done.is_set():
+        try:
+            _ = queue.get(timeout=0.1)
+        except Exception:
+            pass
+
+
+def minimizer_latency(degree: Degree, n_points: int) -> float:
+    point_queue, coeff_queue = Queue(), Queue()
+    minimizer = Minimizer(MinimizerParams(degree, point_queue, coeff_queue))
+    minimizer.start()
+    xy = MAPPER.in_from_many(WORKLOAD.draw(BOUNDS, n_points,
+                                           default_rng(SEED), 0.0))
+    latencies = []
+    for _ in range(REPETITIONS):
+        start = perf_counter()
+        point_queue.put(Positions(time(), xy.T.copy()))
+        _ = coeff_queue.get()
+        latencies.append(perf_counter() - start)
+    minimizer.flag.stop.set()
+    minimizer.flag.done.wait()
+    minimizer.join()
+    return median(latencies)
+
+
+def serial_update_latency(degree: Degree, n_points: int) -> float:
+    estimator = SerialEstimator(degree, MAPPER)
+    events = seeded_events(n_points)
+    estimator.update_with_many(events)
+    rng = default_rng(SEED)
+    latencies = []
+    for event in events[:REPETITIONS]:
+        x, y = WORKLOAD.draw(BOUNDS, 1, rng, 0.0)[0]
+        start = perf_counter()
+        estimator.update_with(Event(event.id, Action.MOVE, PointAt(x, y)))
+        latencies.append(perf_counter() - start)
+    return median(latencies)
+
+
+def evaluation_latencies(degree: Degree) -> dict:
+    estimator = ParallelEstimator(degree, MAPPER, MockParams(1, 1, gaussian))
+    publication = estimator.controller.publication
+    coeffs = default_rng(SEED).normal(size=estimator.snapshot.coeffs.size)
+    coeffs /= coeffs.dot(coeffs)**0.5
+    publication.publish(coeffs, 1000)
+    results = {}
+    for x, y in ((150, 100), (800, 500)):
+        estimator.grid = Grid(x, y)
+        results[f'on_grid {y}x{x}'] = repeated(
+            lambda: estimator.on_grid, lambda: publication.publish(coeffs))
+    xy = WORKLOAD.draw(BOUNDS, 10000, default_rng(SEED), 0.0)
+    results['at_many 10000'] = repeated(
+        lambda: estimator.at_many(xy), lambda: publication.publish(coeffs))
+    point = PointAt(*BOUNDS.center)
+    results['at'] = repeated(lambda: estimator.at(point),
+                             lambda: publication.publish(coeffs))
+    estimator.controller.stop()
+    return results
+
+
+def repeated(call, prepare) -> float:
+    timings = []
+    for _ in range(QUERY_REPETITIONS):
+        prepare()
+        start = perf_counter()
+        _ = call()
+        timings.append(perf_counter() - start)
+    return median(timings)
+
+
+def pipeline_lag(degree: Degree, n_events: int, n_jobs: int) -> dict:
+    handle, path = mkstemp(suffix='.npy')
+    events = zeros(n_events, EVENT_RECORD)
+    rng = default_rng(SEED)
+    events['id'] = frombuffer(rng.bytes(16*n_events), uint8).reshape(-1, 16)
+    events['action'] = Action.ADD.value
+    events['x'], events['y'] = WORKLOAD.draw(BOUNDS, n_events, rng, 0.0).T
+    close(handle)
+    save(path, events)
+    estimator = ParallelEstimator(degree, MAPPER,
+                                  ReplayParams(path, float('inf')))
+    start = perf_counter()
+    estimator.controller.start(n_jobs, 0.1)
+    while estimator.controller.N < n_events:
+        sleep(0.01)
+    ingested = perf_counter() - start
+    previous = estimator.snapshot
+    while perf_counter() - start < SETTLE_TIMEOUT:
+        sleep(0.1)
+        current = estimator.snapshot
+        if l2_distance(previous, current) < SETTLED:
+            break
+        previous = current
+    settled = perf_counter() - start
+    estimator.controller.stop()
+    remove(path)
+    return {'ingest': ingested, 'settle': settled}
+
+
+def run(quick: bool =False) -> dict:
+    scale = 1 if quick else 4
+    results = {}
+
+    def note(name: str, value: float, unit: str, better: str) -> None:
+        results[name] = {'value': float(value), 'unit': unit,
+                         'better': better}
+        print(f'{name:<40} {value:>12.3f} {unit}')
+
+    n_events = 5000 * scale
+    note(f'datagate {n_events} events', datagate_throughput(n_events),
+         'events/s', 'higher')
+    for degree in (Degree(10, 10), Degree(20, 20)):
+        name = f'{degree.k_max}x{degree.l_max}'
+        for n_points in (1000, 2500 * scale):
+            note(f'minimizer {name} N={n_points}',
+                 1e3 * minimizer_latency(degree, n_points), 'ms', 'lower')
+        note(f'serial update {name} N=1000',
+             1e3 * serial_update_latency(degree, 1000), 'ms', 'lower')
+        for query, seconds in evaluation_latencies(degree).items():
+            note(f'{query} {name}', 1e3 * seconds, 'ms', 'lower')
+    lag = pipeline_lag(Degree(10, 10), 500 * scale, 2)
+    note(f'pipeline ingest {500 * scale} events', lag['ingest'], 's', 'lower')
+    note(f'pipeline settle {500 * scale} events', lag['settle'], 's', 'lower')
+    return results
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    failed = []
+    for name in sorted(baseline.keys() - results.keys()):
+        print(f'{name:<40} {"":>9} MISSING FROM RUN')
+        failed.append(name)
+    for name, result in results.items():
+        if name not in baseline:
+            print(f'{name:<40} {"":>9} MISSING FROM BASELINE')
+            failed.append(name)
+            continue
+        ratio = result['value'] / baseline[name]['value']
+        worse = ratio > 1.0 + tolerance if result['better'] == 'lower' \
+            else ratio < 1.0 - tolerance
+        print(f'{name:<40} {ratio:>8.2f}x {"REGRESSION" if worse else ""}')
+        if worse:
+            failed.append(name)
+    return failed
+
+
+if __name__ == '__main__':
+    _ = seterr(over='ignore')
+    parser = ArgumentParser(description='Run the lpde benchmark suite.')
+    parser.add_argument('--out', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='compare against this JSON file')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    parser.add_argument('--quick', action='store_true')
+    arguments = parser.parse_args()
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            baseline = load(file)
+        if baseline['meta']['quick'] != arguments.quick:
+            print('Cannot compare a quick run with a full baseline or vice'
+                  ' versa. Rerun with matching --quick!')
+            exit(1)
+    results = run(arguments.quick)
+    if arguments.out:
+        with open(arguments.out, 'w') as file:
+            dump({'meta': {'time': time(),
+                           'python': python_version(),
+                           'numpy': __version__,
+                           'quick': arguments.quick},
+                  'results': results}, file, indent=2)
+    if arguments.baseline:
+        if regressions(results, baseline['results'], arguments.tolerance):
+            exit(1)
@@ -0,0 +1,185 @@
+from argparse import ArgumentParser
+from json import dump
+from platform import python_version
+from time import perf_counter, process_time, time
+from uuid import UUID
+from numpy import ndarray, median, seterr, exp, absolute, linspace, meshgrid
+from numpy import column_stack
+from numpy import __version__
+from numpy.random import default_rng
+from lpde.geometry import PointAt
+from lpde.estimators import SerialEstimator
+from lpde.estimators.datatypes import Degree, Event, Action
+from .suite import SEED, BOUNDS, MAPPER, WORKLOAD
+try:
+    from sklearn.neighbors import KernelDensity
+    from sklKDE.datatypes import Kernel
+    from sklKDE.density.parameters import KDE_PARAMETERS
+    KERNEL = Kernel('gaussian', 0.015)
+except ImportError:
+    KernelDensity = None
+    KERNEL = None
+
+DEGREES = (Degree(10, 10), Degree(20, 20))
+SIZES = (1000, 5000, 20000)
+CHURN: int = 2000  # Events streamed after the build-up.
+QUERY_EVERY: int = 100  # Events between two queries in the CPU budget.
+TIMED_UPDATES: int = 200
+QUERY_REPETITIONS: int = 5
+EVALUATION_GRID = (150, 100)
+
+
+class Lpde:
+    def __init__(self, degree: Degree) -> None:
+        self.__estimator = SerialEstimator(degree, MAPPER, lazy=True)
+        self.__name = f'lpde {degree.k_max}x{degree.l_max}'
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    def update(self, event: Event) -> None:
+        self.__estimator.update_with(event)
+
+    def refit(self) -> None:
+        self.__estimator.refit()
+
+    def at_many(self, xy: ndarray) -> ndarray:
+        return self.__estimator.at_many(xy).filled(0.0)
+
+
+class SklKde:  # What sklKDE's Streamer and Density do, minus processes.
+    def __init__(self, kernel: 'Kernel') -> None:
+        self.__data = {}
+        self.__kde = KernelDensity(bandwidth=kernel.bandwidth,
+                                   kernel=kernel.name, **KDE_PARAMETERS)
+        self.__name = f'sklKDE {kernel.name} {kernel.bandwidth}'
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    def update(self, event: Event) -> None:
+        if event.action is Action.DELETE:
+            _ = self.__data.pop(event.id, None)
+        elif (event.action is Action.ADD) != (event.id in self.__data):
+            self.__data[event.id] = event.location.position
+
+    def refit(self) -> None:
+        self.__kde.fit(list(self.__data.values()))
+
+    def at_many(self, xy: ndarray) -> ndarray:
+        self.refit()
+        return len(self.__data) * exp(self.__kde.score_samples(xy))
+
+
+def event_stream(n_points: int, n_churn: int, seed: int =SEED) -> list:
+    rng = default_rng(seed)
+    xy = WORKLOAD.draw(BOUNDS, n_points + n_churn, rng, 0.0)
+    live = [UUID(bytes=rng.bytes(16), version=4) for _ in range(n_points)]
+    events = [Event(uuid, Action.ADD, PointAt(x, y))
+              for uuid, (x, y) in zip(live, xy)]
+    for x, y in xy[n_points:]:
+        action = Action(int(rng.integers(-1, 2))) if live else Action.ADD
+        if action is Action.ADD:
+            live.append(UUID(bytes=rng.bytes(16), version=4))
+            uuid = live[-1]
+        else:
+            index = int(rng.integers(len(live)))
+            uuid = live[index]
+        if action is Action.DELETE:
+            live[index] = live[-1]
+            _ = live.pop()
+            events.append(Event(uuid, action))
+        else:
+            events.append(Event(uuid, action, PointAt(x, y)))
+    return events
+
+
+def evaluation_points() -> ndarray:
+    x_line = linspace(*BOUNDS.x_range, EVALUATION_GRID[0])
+    y_line = linspace(*BOUNDS.y_range, EVALUATION_GRID[1])
+    x_grid, y_grid = meshgrid(x_line, y_line)
+    return column_stack((x_grid.ravel(), y_grid.ravel()))
+
+
+def head_to_head(engine, events: list, n_build_up: int) -> dict:
+    point = BOUNDS.center[None]
+    grid = evaluation_points()
+    n_streamed = n_build_up + CHURN
+    start = process_time()
+    for event in events[:n_build_up]:
+        engine.update(event)
+    _ = engine.at_many(point)
+    for count, event in enumerate(events[n_build_up:n_streamed], 1):
+        engine.update(event)
+        if not count % QUERY_EVERY:
+            _ = engine.at_many(point)
+    cpu = (process_time() - start) / n_streamed
+    updates = []
+    for event in events[n_streamed:n_streamed + TIMED_UPDATES]:
+        start = perf_counter()
+        engine.update(event)
+        engine.refit()  # Until the estimate reflects the event.
+        updates.append(perf_counter() - start)
+    queries, grids = [], []
+    for event in events[n_streamed + TIMED_UPDATES:]:
+        engine.update(event)
+        start = perf_counter()
+        _ = engine.at_many(point)
+        queries.append(perf_counter() - start)
+        start = perf_counter()
+        estimate = engine.at_many(grid)
+        grids.append(perf_counter() - start)
+    truth = WORKLOAD.pdf(grid, BOUNDS, 0.0)
+    estimate /= estimate.sum() / truth.sum()
+    return {'cpu/event': (1e6 * cpu, 'us'),
+            'update': (1e6 * median(updates), 'us'),
+            'query': (1e3 * median(queries), 'ms'),
+            'grid': (1e3 * median(grids), 'ms'),
+            'L1 error': (absolute(estimate - truth).sum() / truth.sum(),
+                         'of mass')}
+
+
+def run(quick: bool =False) -> dict:
+    sizes = SIZES[:2] if quick else SIZES
+    engines = [lambda degree=degree: Lpde(degree) for degree in DEGREES]
+    if KernelDensity is None:
+        print('Could not import sklKDE (needs scikit-learn), skipping it.')
+    else:
+        engines.append(lambda: SklKde(KERNEL))
+    results = {}
+    print(f'{"engine":<24}{"N":>7}{"cpu/event us":>14}{"update us":>14}'
+          f'{"query ms":>14}{"grid ms":>14}{"L1 error":>14}')
+    for n_points in sizes:
+        events = event_stream(n_points, CHURN + TIMED_UPDATES +
+                              QUERY_REPETITIONS)
+        for make in engines:
+            engine = make()
+            measured = head_to_head(engine, events, n_points)
+            row = f'{engine.name:<24}{n_points:>7}'
+            for metric, (value, unit) in measured.items():
+                results[f'{engine.name} N={n_points} {metric}'] = {
+                    'value': float(value), 'unit': unit, 'better': 'lower'}
+                row += f'{value:>14.3f}'
+            print(row)
+    return results
+
+
+if __name__ == '__main__':
+    _ = seterr(over='ignore')
+    parser = ArgumentParser(description='Benchmark lpde against sklKDE.')
+    parser.add_argument('--out', help='write results to this JSON file')
+    parser.add_argument('--quick', action='store_true')
+    arguments = parser.parse_args()
+    results = run(arguments.quick)
+    if arguments.out:
+        with open(arguments.out, 'w') as file:
+            dump({'meta': {'time': time(),
+                           'python': python_version(),
+                           'numpy': __version__,
+                           'quick': arguments.quick,
+                           'churn': CHURN,
+                           'kernel': None if KERNEL is None else
+                                     [KERNEL.name, KERNEL.bandwidth]},
+                  'results': results}, file, indent=2)
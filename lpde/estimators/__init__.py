@@ -1,2 +1,2 @@
 from .serial import SerialEstimator
-from .parallel import ParallelEstimator
+from .parallel import ParallelEstimator, FanOut
@@ -0,0 +1,35 @@
+from numpy import ndarray, float64, einsum, newaxis, sqrt
+from numpy.polynomial.legendre import legvander, leggauss
+from .datatypes import Snapshot
+
+
+def snapshot_type_checked(value: Snapshot) -> Snapshot:
+    if type(value) is not Snapshot:
+        raise TypeError('Snapshots must be of type <Snapshot>!')
+    return value
+
+
+def products(lower: ndarray, upper: ndarray, degree: int) -> ndarray:
+    nodes, weights = leggauss(degree + 1)
+    half_width = (upper - lower)[:, newaxis] / 2.0
+    middle = (upper + lower)[:, newaxis] / 2.0
+    basis = legvander(middle + half_width*nodes, degree)
+    return einsum('mq,mqk,mql->mkl', half_width*weights, basis, basis)
+
+
+def marginal(coeffs: ndarray, other_products: ndarray,
+             mapped: ndarray) -> ndarray:
+    gram = coeffs @ other_products @ coeffs.T
+    basis = legvander(mapped, coeffs.shape[0] - 1)
+    return (basis @ gram * basis).sum(axis=1)
+
+
+def l2_distance(snapshot_a: Snapshot, snapshot_b: Snapshot) -> float64:
+    snapshot_a = snapshot_type_checked(snapshot_a)
+    snapshot_b = snapshot_type_checked(snapshot_b)
+    if snapshot_a.coeffs.shape != snapshot_b.coeffs.shape:
+        raise ValueError('Snapshots must be of the same polynomial degree!')
+    overlap = abs(snapshot_a.coeffs.dot(snapshot_b.coeffs))
+    squared = (snapshot_a.coeffs.dot(snapshot_a.coeffs) +
+               snapshot_b.coeffs.dot(snapshot_b.coeffs) - 2.0*overlap)
+    return sqrt(max(squared, 0.0))
@@ -0,0 +1,132 @@
+from os import replace
+from time import time
+from uuid import UUID
+from numpy import ndarray, int64, float64, uint8, dtype, memmap, empty
+from numpy import array, array_equal, frombuffer, column_stack
+from .datatypes import Degree
+from ..geometry import Mapper
+
+FORMAT: int = 1
+INTEGER_FIELDS: int = 4  # Format, k_max, l_max, and number of points.
+FLOAT_FIELDS: int = 6  # Time, center x and y, window x and y, and width.
+FLOAT_OFFSET: int = INTEGER_FIELDS * int64().itemsize
+COEFF_OFFSET: int = FLOAT_OFFSET + FLOAT_FIELDS * float64().itemsize
+RECORD = dtype([('id', uint8, 16), ('x', float64), ('y', float64)])
+
+
+class Checkpoint:
+    def __init__(self, degree: Degree, mapper: Mapper, coeffs: ndarray,
+                 ids: list, xy: ndarray) -> None:
+        degree = self.__degree_type_checked(degree)
+        mapper = self.__mapper_type_checked(mapper)
+        self.__coeffs = self.__coeffs_type_and_shape_checked(coeffs, degree)
+        ids = self.__ids_type_checked(ids)
+        xy = self.__array_type_and_shape_checked(xy, len(ids))
+        self.__integers = array([FORMAT, *degree, len(ids)], int64)
+        self.__floats = array([time(), *self.__geometry_of(mapper)])
+        self.__records = empty(len(ids), RECORD)
+        uuids = b''.join(uuid.bytes for uuid in ids)
+        self.__records['id'] = frombuffer(uuids, uint8).reshape(-1, 16)
+        self.__records['x'], self.__records['y'] = xy.T
+
+    @classmethod
+    def load(cls, path: str) -> 'Checkpoint':
+        if type(path) is not str:
+            raise TypeError('Path to the checkpoint must be a string!')
+        memory = memmap(path, uint8, 'r')
+        checkpoint = cls.__new__(cls)
+        checkpoint.__integers = ndarray((INTEGER_FIELDS,), int64, memory, 0)
+        if checkpoint.__integers[0] != FORMAT:
+            raise ValueError(f'File "{path}" is not a valid checkpoint!')
+        _, k_max, l_max, n_points = map(int, checkpoint.__integers)
+        n_coeffs = (k_max + 1) * (l_max + 1)
+        checkpoint.__floats = ndarray((FLOAT_FIELDS,), float64,
+                                      memory, FLOAT_OFFSET)
+        checkpoint.__coeffs = ndarray((n_coeffs,), float64,
+                                      memory, COEFF_OFFSET)
+        record_offset = COEFF_OFFSET + checkpoint.__coeffs.nbytes
+        checkpoint.__records = ndarray((n_points,), RECORD,
+                                       memory, record_offset)
+        return checkpoint
+
+    def save(self, path: str) -> None:
+        if type(path) is not str:
+            raise TypeError('Path to the checkpoint must be a string!')
+        with open(path + '.tmp', 'wb') as file:
+            for block in (self.__integers, self.__floats,
+                          self.__coeffs, self.__records):
+                file.write(block.tobytes())
+        replace(path + '.tmp', path)
+
+    @property
+    def degree(self) -> Degree:
+        return Degree(*map(int, self.__integers[1:3]))
+
+    @property
+    def time(self) -> float:
+        return float(self.__floats[0])
+
+    @property
+    def N(self) -> int:
+        return int(self.__integers[3])
+
+    @property
+    def coeffs(self) -> ndarray:
+        return self.__coeffs
+
+    @property
+    def ids(self) -> list:
+        return [UUID(bytes=uuid.tobytes()) for uuid in self.__records['id']]
+
+    @property
+    def xy(self) -> ndarray:
+        return column_stack((self.__records['x'], self.__records['y']))
+
+    def fits(self, degree: Degree, mapper: Mapper) -> bool:
+        geometry = self.__geometry_of(mapper)
+        return self.degree == degree and array_equal(self.__floats[1:],
+                                                     geometry)
+
+    @staticmethod
+    def __geometry_of(mapper: Mapper) -> list:
+        return [*mapper.bounds.center,
+                *mapper.bounds.window,
+                2.0 * mapper.legendre_interval[1]]
+
+    @staticmethod
+    def __degree_type_checked(value: Degree) -> Degree:
+        if type(value) is not Degree:
+            raise TypeError('Polynomial degree must be of type <Degree>!')
+        return value
+
+    @staticmethod
+    def __mapper_type_checked(value: Mapper) -> Mapper:
+        if type(value) is not Mapper:
+            raise TypeError('Type of mapper must be <Mapper>!')
+        return value
+
+    @staticmethod
+    def __coeffs_type_and_shape_checked(value: ndarray,
+                                        degree: Degree) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Coefficients must be a numpy array!')
+        if value.shape != ((degree.k_max + 1) * (degree.l_max + 1),):
+            raise ValueError('Coefficients do not match polynomial degree!')
+        return value.astype(float64)
+
+    @staticmethod
+    def __ids_type_checked(value: list) -> list:
+        if type(value) is not list:
+            raise TypeError('IDs must be given as a list!')
+        if not all(type(uuid) is UUID for uuid in value):
+            raise TypeError('IDs must all be of type <UUID>!')
+        return value
+
+    @staticmethod
+    def __array_type_and_shape_checked(value: ndarray,
+                                       n_points: int) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Locations must be given as a numpy array!')
+        if value.shape != (n_points, 2):
+            raise ValueError('Locations must be an array of shape (N, 2)!')
+        return value
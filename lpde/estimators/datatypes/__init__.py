@@ -5,3 +5,9 @@ from .event import Event
 from .lagrange import LagrangeCoefficients
 from .scalings import Scalings
 from .flags import Flags
+from .snapshot import Snapshot
+from .positions import Positions
+from .solution import Solution
+from .record import EVENT_RECORD
+from .timings import Timings
+from .overload import Overload
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class Overload(Enum):
+    BLOCK: int = 0
+    DROP_OLDEST: int = 1
+    SAMPLE: int = 2
+    COALESCE: int = 3
+
+
+if __name__ == '__main__':
+    policy = Overload.BLOCK
+    print(policy)
+
+    another_policy = Overload(3)
+    print(another_policy)
@@ -0,0 +1,35 @@
+from collections import namedtuple
+from numpy import ndarray, float64
+
+PositionsBase = namedtuple('Positions', ['time', 'xy'])
+
+
+class Positions(PositionsBase):
+    def __new__(cls, time: float, xy: ndarray) -> PositionsBase:
+        time = cls.__float_type_checked(time)
+        xy = cls.__array_type_checked(xy)
+        self = super().__new__(cls, time, xy)
+        return self
+
+    __slots__ = ()
+
+    @staticmethod
+    def __float_type_checked(value: float) -> float:
+        if type(value) not in (int, float, float64):
+            raise TypeError('Time stamp must be a number!')
+        return float(value)
+
+    @staticmethod
+    def __array_type_checked(value: ndarray) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Matrix with data points must be a numpy array!')
+        return value
+
+
+if __name__ == '__main__':
+    from time import time
+    from numpy import zeros
+
+    positions = Positions(time(), zeros((2, 5)))
+    print(positions.time)
+    print(positions.xy)
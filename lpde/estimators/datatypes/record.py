@@ -0,0 +1,15 @@
+from numpy import dtype, float64, int8, uint8
+
+EVENT_RECORD = dtype([('time', float64),
+                      ('id', uint8, 16),
+                      ('action', int8),
+                      ('x', float64),
+                      ('y', float64)])
+
+
+if __name__ == '__main__':
+    from numpy import zeros
+
+    records = zeros(3, EVENT_RECORD)
+    print(records.dtype)
+    print(records['time'])
@@ -0,0 +1,46 @@
+from collections import namedtuple
+from numpy import ndarray, float64
+
+SnapshotBase = namedtuple('Snapshot', ['version', 'time', 'N', 'coeffs'])
+
+
+class Snapshot(SnapshotBase):
+    def __new__(cls, version: int, time: float, N: int,
+                coeffs: ndarray) -> SnapshotBase:
+        version = cls.__integer_type_and_range_checked(version)
+        time = cls.__float_type_checked(time)
+        N = cls.__integer_type_and_range_checked(N)
+        coeffs = cls.__array_type_checked(coeffs)
+        self = super().__new__(cls, version, time, N, coeffs)
+        return self
+
+    __slots__ = ()
+
+    @staticmethod
+    def __integer_type_and_range_checked(value: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Version and number of points must be integers!')
+        if value < 0:
+            raise ValueError('Version and number of points must not be < 0!')
+        return value
+
+    @staticmethod
+    def __float_type_checked(value: float) -> float:
+        if type(value) not in (int, float, float64):
+            raise TypeError('Time stamp must be a number!')
+        return float(value)
+
+    @staticmethod
+    def __array_type_checked(value: ndarray) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Coefficients must be a numpy array!')
+        return value
+
+
+if __name__ == '__main__':
+    from numpy import zeros
+
+    snapshot = Snapshot(3, 1.5, 10, zeros(4))
+    print(snapshot)
+    print(snapshot.version)
+    print(snapshot.coeffs)
@@ -0,0 +1,45 @@
+from collections import namedtuple
+from numpy import ndarray, float64
+
+SolutionBase = namedtuple('Solution', ['time', 'N', 'coeffs'])
+
+
+class Solution(SolutionBase):
+    def __new__(cls, time: float, N: int, coeffs: ndarray) -> SolutionBase:
+        time = cls.__float_type_checked(time)
+        N = cls.__integer_type_and_range_checked(N)
+        coeffs = cls.__array_type_checked(coeffs)
+        self = super().__new__(cls, time, N, coeffs)
+        return self
+
+    __slots__ = ()
+
+    @staticmethod
+    def __float_type_checked(value: float) -> float:
+        if type(value) not in (int, float, float64):
+            raise TypeError('Time stamp must be a number!')
+        return float(value)
+
+    @staticmethod
+    def __integer_type_and_range_checked(value: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Number of points must be an integer!')
+        if value < 0:
+            raise ValueError('Number of points must not be negative!')
+        return value
+
+    @staticmethod
+    def __array_type_checked(value: ndarray) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Coefficients must be a numpy array!')
+        return value
+
+
+if __name__ == '__main__':
+    from time import time
+    from numpy import zeros
+
+    solution = Solution(time(), 10, zeros(4))
+    print(solution.time)
+    print(solution.N)
+    print(solution.coeffs)
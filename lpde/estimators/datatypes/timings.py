@@ -0,0 +1,53 @@
+from multiprocessing.sharedctypes import RawArray
+from time import perf_counter
+
+
+class Timings:
+    def __init__(self, stages: tuple) -> None:
+        self.__stages = self.__stages_type_checked(stages)
+        self.__index_of = {stage: i for i, stage in enumerate(self.__stages)}
+        self.__seconds = RawArray('d', len(self.__stages))
+        self.__counts = RawArray('d', len(self.__stages))
+
+    @property
+    def stages(self) -> tuple:
+        return self.__stages
+
+    @property
+    def seconds(self) -> dict:
+        return dict(zip(self.__stages, self.__seconds))
+
+    @property
+    def counts(self) -> dict:
+        return {stage: int(count)
+                for stage, count in zip(self.__stages, self.__counts)}
+
+    def add(self, stage: str, seconds: float) -> None:
+        index = self.__index_of[stage]
+        self.__seconds[index] += seconds
+        self.__counts[index] += 1
+
+    def since(self, stage: str, start: float) -> float:
+        now = perf_counter()
+        self.add(stage, now - start)
+        return now
+
+    @staticmethod
+    def __stages_type_checked(value: tuple) -> tuple:
+        if type(value) is not tuple or not value:
+            raise TypeError('Stages must be given as a non-empty tuple!')
+        if not all(type(stage) is str for stage in value):
+            raise TypeError('Names of stages must be strings!')
+        if len(set(value)) != len(value):
+            raise ValueError('Names of stages must be unique!')
+        return value
+
+
+if __name__ == '__main__':
+    timings = Timings(('receive', 'solve'))
+    tick = perf_counter()
+    tick = timings.since('receive', tick)
+    _ = sum(range(100000))
+    tick = timings.since('solve', tick)
+    print(timings.seconds)
+    print(timings.counts)
@@ -1 +1,2 @@
 from .parallel import ParallelEstimator
+from .fanout import FanOut
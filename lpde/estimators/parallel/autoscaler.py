@@ -0,0 +1,116 @@
+from math import ceil
+from os import cpu_count
+from threading import Thread
+from time import perf_counter
+from numpy import float64
+from ..datatypes import Flags
+
+INTERVAL: float = 2.0  # Seconds between two scaling decisions.
+TARGET: float = 0.75  # Fraction of time minimizers should spend working.
+COOLDOWN: int = 3  # Consecutive calm intervals before removing a worker.
+OTHER_PROCESSES: int = 3  # Producer, DataGate and Smoother need cores, too.
+BUSY_STAGES = ('basis', 'solve', 'push')
+
+
+class Autoscaler(Thread):
+    def __init__(self, controller, minimum: int =1, maximum: int =None,
+                 interval: float =INTERVAL) -> None:
+        super().__init__(daemon=True)
+        self.__controller = controller
+        self.__minimum = self.__integer_type_and_range_checked(minimum, 1)
+        if maximum is None:
+            maximum = max(cpu_count() - OTHER_PROCESSES, self.__minimum)
+        self.__maximum = self.__integer_type_and_range_checked(maximum,
+                                                               self.__minimum)
+        self.__interval = self.__float_type_and_range_checked(interval)
+        self.__flag = Flags()
+        self.__busy = {}
+        self.__measured = perf_counter()
+        self.__utilization = 0.0
+        self.__latency = 0.0
+
+    @property
+    def flag(self) -> Flags:
+        return self.__flag
+
+    @property
+    def minimum(self) -> int:
+        return self.__minimum
+
+    @property
+    def maximum(self) -> int:
+        return self.__maximum
+
+    @property
+    def utilization(self) -> float:
+        return self.__utilization
+
+    @property
+    def latency(self) -> float:
+        return self.__latency
+
+    def run(self) -> None:
+        calm = 0
+        _ = self.__measure(perf_counter())
+        self.__utilization = 0.0  # Work done before we started watching.
+        while not self.__flag.stop.wait(self.__interval):
+            n_jobs = self.__controller.n_jobs
+            wanted = self.__wanted(self.__measure(perf_counter()), n_jobs)
+            if wanted > n_jobs:
+                self.__controller.add_minimizers(wanted - n_jobs)
+                calm = 0
+            elif wanted < n_jobs:
+                calm += 1
+                if calm >= COOLDOWN:
+                    self.__controller.remove_minimizers(1)
+                    calm = 0
+            else:
+                calm = 0
+        self.__flag.done.set()
+
+    def __measure(self, now: float) -> float:
+        minimizers = self.__controller.minimizers  # Copied under the lock.
+        busy, solves = 0.0, 0
+        for minimizer in minimizers:
+            seconds = minimizer.timings.seconds
+            counts = minimizer.timings.counts
+            total = sum(seconds[stage] for stage in BUSY_STAGES)
+            previous_total, previous_count = self.__busy.get(minimizer, (0, 0))
+            busy += total - previous_total
+            solves += counts['solve'] - previous_count
+            self.__busy[minimizer] = (total, counts['solve'])
+        self.__busy = {m: self.__busy[m] for m in minimizers}
+        elapsed = (now - self.__measured) * len(minimizers)
+        self.__measured = now
+        self.__utilization = busy / elapsed if elapsed > 0 else 0.0
+        if solves:
+            self.__latency = busy / solves
+        return self.__utilization
+
+    def __wanted(self, utilization: float, n_jobs: int) -> int:
+        backlog = self.__depth() * self.__latency / self.__interval
+        demand = (utilization * n_jobs + backlog) / TARGET
+        return min(max(ceil(demand), self.__minimum), self.__maximum)
+
+    def __depth(self) -> int:
+        try:
+            return self.__controller.point_queue.qsize()
+        except NotImplementedError:
+            return 0
+
+    @staticmethod
+    def __integer_type_and_range_checked(value: int, lowest: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Bounds on number of workers must be integers!')
+        if value < lowest:
+            raise ValueError('Bounds on number of workers must be at'
+                             f' least {lowest}!')
+        return value
+
+    @staticmethod
+    def __float_type_and_range_checked(value: float) -> float:
+        if type(value) not in (int, float, float64):
+            raise TypeError('Autoscaling interval must be a number!')
+        if value <= 0:
+            raise ValueError('Autoscaling interval must be positive!')
+        return float(value)
@@ -0,0 +1,39 @@
+from typing import Any, Hashable
+
+
+class Cache:
+    def __init__(self) -> None:
+        self.__entries = {}
+        self.__hits = {}
+        self.__misses = {}
+
+    @property
+    def stats(self) -> dict:
+        return {name: {'hits': self.__hits.get(name, 0),
+                       'misses': self.__misses.get(name, 0)}
+                for name in sorted(set(self.__hits) | set(self.__misses))}
+
+    def get(self, name: str, key: Hashable) -> Any:
+        cached_key, value = self.__entries.get(name, (None, None))
+        if value is not None and cached_key == key:
+            self.__hits[name] = self.__hits.get(name, 0) + 1
+            return value
+        self.__misses[name] = self.__misses.get(name, 0) + 1
+        return None
+
+    def put(self, name: str, key: Hashable, value: Any) -> Any:
+        self.__entries[name] = (key, value)
+        return value
+
+    def clear(self, *names: str) -> None:
+        for name in names or tuple(self.__entries):
+            _ = self.__entries.pop(name, None)
+
+
+if __name__ == '__main__':
+    cache = Cache()
+    print(cache.get('density', (1, 10)))
+    cache.put('density', (1, 10), 'on grid')
+    print(cache.get('density', (1, 10)))
+    print(cache.get('density', (2, 10)))
+    print(cache.stats)
@@ -1,19 +1,30 @@
 from multiprocessing import Process, Queue, Array, Pipe
-from numpy import float64
+from threading import Lock, Thread
+from os import makedirs
+from os.path import isfile
+from numpy import float64, array_equal
 from .datagate import DataGateParams, DataGate
 from .minimizer import MinimizerParams, Minimizer
 from .smoother import SmootherParams, Smoother
-from ..datatypes import Degree, Coefficients
+from .publication import Publication
+from .history import History
+from .autoscaler import Autoscaler, INTERVAL
+from ..datatypes import Degree, Coefficients, Overload
+from ..checkpoint import Checkpoint
+from ..profiling import profile_into
 from ...geometry import Mapper
-from ...producers import MockProducer, PRODUCER_TYPES
+from ...producers import PRODUCERS
 
 MAXIMAL_QUEUE_SIZE: int = 1000
+HISTORY_SUFFIX: str = '_history'
+FOLLOWER_OVERLOAD = Overload.COALESCE  # Slow followers must not block others.
 QUEUE = type(Queue())
 ARRAY = type(Array('d', 10))
 
 
 class Controller:
-    def __init__(self, degree: Degree, mapper: Mapper, produce_params) -> None:
+    def __init__(self, degree: Degree, mapper: Mapper, produce_params,
+                 name: str =None) -> None:
         self.__degree = self.__degree_type_checked(degree)
         self.__mapper = self.__mapper_type_checked(mapper)
         self.__produce_params = self.__params_type_checked(produce_params)
@@ -21,16 +32,28 @@ class Controller:
         self.__point_queue = Queue(maxsize=MAXIMAL_QUEUE_SIZE)
         self.__coeff_queue = Queue(maxsize=MAXIMAL_QUEUE_SIZE)
         self.__smooth_coeffs = Array('d', Coefficients(self.__degree).vec)
+        self.__publication = Publication(self.__degree, self.__mapper, name)
+        self.__history = History(self.__degree,
+                                 self.__publication.name + HISTORY_SUFFIX)
         self.__datagate_params = DataGateParams(self.__degree,
                                                 self.__mapper,
                                                 self.__event_pipe_out,
-                                                self.__point_queue)
+                                                self.__point_queue,
+                                                self.__publication)
         self.__minimizer_params = MinimizerParams(self.__degree,
                                                   self.__point_queue,
                                                   self.__coeff_queue)
         self.__smoother_params = SmootherParams(self.__coeff_queue,
-                                                self.__smooth_coeffs)
+                                                self.__smooth_coeffs,
+                                                self.__publication,
+                                                self.__history)
+        self.__leader = None
+        self.__followers = []
+        self.__overload = Overload.BLOCK
         self.__minimizers = []
+        self.__retiring = []
+        self.__pool_lock = Lock()
+        self.__profile = None
         self.__class_prefix = '_' + self.__class__.__name__ + '__'
 
     @property
@@ -55,8 +78,9 @@ class Controller:
 
     @property
     def minimizers(self) -> list:
-        if self.__minimizers:
-            return self.__minimizers
+        minimizers = self.__pool
+        if minimizers:
+            return minimizers
         raise AttributeError('Minimizer process(es) not started yet!')
 
     @property
@@ -65,6 +89,12 @@ class Controller:
             return self.__smoother
         raise AttributeError('Smoother process not started yet!')
 
+    @property
+    def autoscaler(self) -> Autoscaler:
+        if self.__has('autoscaler'):
+            return self.__autoscaler
+        raise AttributeError('Autoscaler not started yet!')
+
     @property
     def alive(self) -> dict:
         living = {'Producer': False, 'Datagate': False, 'Smoother': False}
@@ -74,9 +104,25 @@ class Controller:
             living['Datagate'] = True
         if self.__has('smoother') and self.__smoother.is_alive():
             living['Smoother'] = True
-        living['Minimizers'] = tuple(m.is_alive() for m in self.__minimizers)
+        living['Minimizers'] = tuple(m.is_alive() for m in self.__pool)
         return living
 
+    @property
+    def timings(self) -> dict:
+        timings = {'Producer': None, 'Datagate': None, 'Smoother': None}
+        if self.__has('producer') and hasattr(self.__producer, 'timings'):
+            timings['Producer'] = self.__producer.timings
+        if self.__has('datagate'):
+            timings['Datagate'] = self.__datagate.timings
+        if self.__has('smoother'):
+            timings['Smoother'] = self.__smoother.timings
+        timings['Minimizers'] = tuple(m.timings for m in self.__pool)
+        return timings
+
+    @property
+    def profile(self) -> str:
+        return self.__profile
+
     @property
     def open(self) -> dict:
         return {'Events in': not self.__event_pipe_in.closed,
@@ -95,63 +141,186 @@ class Controller:
 
     @property
     def n_jobs(self) -> int:
-        return len(self.__minimizers)
+        return len(self.__pool)
+
+    @property
+    def __pool(self) -> list:
+        with self.__pool_lock:
+            return list(self.__minimizers)
+
+    @property
+    def __retired(self) -> list:
+        with self.__pool_lock:
+            return list(self.__retiring)
 
     @property
     def N(self) -> int:
-        return self.__datagate.N if self.__has('datagate') else 0
+        if self.__has('datagate'):
+            return self.__datagate.N
+        return 0 if self.__leader is None else self.__publication.N
+
+    @property
+    def leader(self) -> 'Controller':
+        return self.__leader
+
+    @property
+    def followers(self) -> tuple:
+        return tuple(self.__followers)
+
+    @property
+    def overload(self) -> Overload:
+        return self.__overload
+
+    @property
+    def shed(self) -> dict:
+        if self.__has('datagate'):
+            return self.__datagate.shed
+        return {'snapshots': 0}
 
     @property
     def smooth_coeffs(self) -> ARRAY:
         return self.__smooth_coeffs
 
-    def start(self, n_jobs: int =1, decay: float =1.0) -> None:
+    @property
+    def publication(self) -> Publication:
+        return self.__publication
+
+    @property
+    def history(self) -> History:
+        return self.__history
+
+    def fan_out_to(self, follower: 'Controller') -> None:
+        follower = self.__follower_checked(follower)
+        follower.__leader = self
+        follower.__overload = FOLLOWER_OVERLOAD
+        self.__followers.append(follower)
+
+    def start(self, n_jobs: int =1, decay: float =1.0,
+              checkpoint: str =None, record: str =None,
+              profile: str =None,
+              overload: Overload =None) -> None:
         if self.__point_queue._closed or self.__coeff_queue._closed:
             raise OSError('Some queues have been closed. Instantiate a'
                           ' new <Parallel> object to get going again!')
+        checkpoint = self.__path_type_checked(checkpoint)
+        record = self.__path_type_checked(record)
+        profile = self.__path_type_checked(profile)
+        if overload is not None:
+            self.__overload = self.__overload_type_checked(overload)
+        if profile is not None:
+            makedirs(profile, exist_ok=True)
+            self.__profile = profile
+        if checkpoint is not None and isfile(checkpoint):
+            self.__warm_start_from(checkpoint)
         self.__start_smoother(decay)
         self.__start_minimizers(n_jobs)
-        self.__start_datagate()
-        self.__start_producer()
+        if self.__leader is None:
+            self.__start_datagate(checkpoint, record)
+            self.__start_producer()
+
+    def __warm_start_from(self, checkpoint: str) -> None:
+        checkpoint = Checkpoint.load(checkpoint)
+        if checkpoint.fits(self.__degree, self.__mapper):
+            with self.__smooth_coeffs.get_lock():
+                self.__smooth_coeffs.get_obj()[:] = checkpoint.coeffs
+            self.__publication.publish(checkpoint.coeffs,
+                                       len(checkpoint.ids))
 
     def __start_producer(self) -> None:
         if not self.__has('producer'):
-            self.__producer = MockProducer(self.__produce_params,
-                                           self.__mapper.bounds,
-                                           self.__event_pipe_in)
-            self.__producer.start()
+            producer = PRODUCERS[type(self.__produce_params)]
+            self.__producer = producer(self.__produce_params,
+                                       self.__mapper.bounds,
+                                       self.__event_pipe_in)
+            self.__profiled(self.__producer).start()
 
-    def __start_datagate(self) -> None:
+    def __start_datagate(self, checkpoint: str =None,
+                         record: str =None) -> None:
         if not self.__has('datagate'):
-            self.__datagate = DataGate(self.__datagate_params)
-            self.__datagate.start()
+            fan_out = [(follower.point_queue, follower.overload)
+                       for follower in self.__followers]
+            self.__datagate_params = DataGateParams(self.__degree,
+                                                    self.__mapper,
+                                                    self.__event_pipe_out,
+                                                    self.__point_queue,
+                                                    self.__publication,
+                                                    fan_out)
+            self.__datagate = DataGate(self.__datagate_params,
+                                       checkpoint, record, self.__overload)
+            self.__profiled(self.__datagate).start()
 
     def __start_minimizers(self, n_jobs: int =1) -> None:
         n_jobs = self.__integer_type_and_range_checked(n_jobs)
-        for n in range(n_jobs):
-            minimizer = Minimizer(self.__minimizer_params)
-            self.__minimizers.append(minimizer)
-            minimizer.start()
+        with self.__pool_lock:
+            for n in range(n_jobs):
+                minimizer = Minimizer(self.__minimizer_params)
+                self.__minimizers.append(minimizer)
+                self.__profiled(minimizer).start()
+
+    def add_minimizers(self, n_jobs: int =1) -> None:
+        if not self.__minimizers:
+            raise AttributeError('Minimizer process(es) not started yet!')
+        self.__start_minimizers(n_jobs)
+
+    def remove_minimizers(self, n_jobs: int =1) -> None:
+        n_jobs = self.__integer_type_and_range_checked(n_jobs)
+        with self.__pool_lock:
+            if n_jobs >= len(self.__minimizers):
+                raise ValueError('At least one minimizer must keep running!')
+            retired = self.__minimizers[-n_jobs:]
+            del self.__minimizers[-n_jobs:]
+            self.__retiring.extend(retired)
+        for minimizer in retired:
+            minimizer.retire.set()
+        Thread(target=self.__reap, args=(retired,), daemon=True).start()
+
+    def __reap(self, retired: list) -> None:
+        for minimizer in retired:
+            minimizer.flag.done.wait()
+            minimizer.join()
+            with self.__pool_lock:
+                self.__retiring.remove(minimizer)
+
+    def autoscale(self, minimum: int =1, maximum: int =None,
+                  interval: float =INTERVAL) -> None:
+        if not self.__minimizers:
+            raise AttributeError('Minimizer process(es) not started yet!')
+        if self.__has('autoscaler') and self.__autoscaler.is_alive():
+            raise RuntimeError('Autoscaler is already running!')
+        self.__autoscaler = Autoscaler(self, minimum, maximum, interval)
+        self.__autoscaler.start()
 
     def __start_smoother(self, decay: float =1.0) -> None:
         decay = self.__float_type_and_range_checked(decay)
         if not self.__has('smoother'):
             self.__smoother = Smoother(self.__smoother_params, decay)
-            self.__smoother.start()
+            self.__profiled(self.__smoother).start()
+
+    def __profiled(self, process: Process) -> Process:
+        if self.__profile is not None:
+            profile_into(process, self.__profile)
+        return process
 
     def stop(self) -> None:
+        if self.__leader is not None and self.__leader.alive['Datagate']:
+            raise RuntimeError('Stop the leading controller instead!')
         self.__stop_processes()
         self.__join_processes()
         self.__close_pipe_and_queues()
+        for follower in self.__followers:
+            follower.stop()
 
     def __stop_processes(self) -> None:
+        if self.__has('autoscaler'):
+            self.__autoscaler.flag.stop.set()
+            self.__autoscaler.join()
         if self.__has('producer'):
             self.__producer.flag.stop.set()
             self.__producer.flag.done.wait()
         if self.__has('datagate'):
             self.__datagate.flag.stop.set()
             self.__datagate.flag.done.wait()
-        for minimizer in self.__minimizers:
+        for minimizer in self.__pool + self.__retired:
             minimizer.flag.stop.set()
             minimizer.flag.done.wait()
         if self.__has('smoother'):
@@ -163,7 +332,7 @@ class Controller:
             self.__producer.join()
         if self.__has('datagate'):
             self.__datagate.join()
-        for minimizer in self.__minimizers:
+        for minimizer in self.__pool + self.__retired:
             minimizer.join()
         if self.__has('smoother'):
             self.__smoother.join()
@@ -175,6 +344,8 @@ class Controller:
         self.__point_queue.join_thread()
         self.__coeff_queue.close()
         self.__coeff_queue.join_thread()
+        self.__publication.unlink()
+        self.__history.unlink()
 
     @staticmethod
     def __degree_type_checked(value: Degree) -> Degree:
@@ -190,11 +361,43 @@ class Controller:
 
     @staticmethod
     def __params_type_checked(value):
-        if type(value) not in PRODUCER_TYPES:
-            err_msg = 'Type of producer parameters must be in PRODUCER_TYPES!'
+        if type(value) not in PRODUCERS:
+            err_msg = 'Type of producer parameters must be in PRODUCERS!'
             raise TypeError(err_msg)
         return value
 
+    @staticmethod
+    def __path_type_checked(value: str) -> str:
+        if value is not None and type(value) is not str:
+            raise TypeError('Paths to files must be strings!')
+        return value
+
+    def __follower_checked(self, value: 'Controller') -> 'Controller':
+        if type(value) is not Controller:
+            raise TypeError('Followers must be of type <Controller>!')
+        if value is self or value.__leader is not None:
+            raise ValueError('Controller already follows a leader!')
+        if self.__leader is not None or value.__followers:
+            raise ValueError('Controllers cannot both lead and follow!')
+        if self.__has('datagate') or value.__minimizers:
+            raise RuntimeError('Fan out before starting any controller!')
+        if not array_equal(self.__geometry_of(self.__mapper),
+                           self.__geometry_of(value.__mapper)):
+            raise ValueError('Followers must map points the same way!')
+        return value
+
+    @staticmethod
+    def __geometry_of(mapper: Mapper) -> list:
+        return [*mapper.bounds.center,
+                *mapper.bounds.window,
+                *mapper.legendre_interval]
+
+    @staticmethod
+    def __overload_type_checked(value: Overload) -> Overload:
+        if type(value) is not Overload:
+            raise TypeError('Overload policy must be of type <Overload>!')
+        return value
+
     @staticmethod
     def __integer_type_and_range_checked(value: int) -> int:
         if type(value) is not int:
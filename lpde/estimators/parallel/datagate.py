@@ -1,22 +1,39 @@
 from multiprocessing import Process, Queue, Value
 from multiprocessing.connection import Connection
-from queue import Full
-from numpy import ndarray
+from os.path import isfile
+from queue import Full, Empty
+from time import time, perf_counter
+from numpy import float64
 from pandas import DataFrame
-from ..datatypes import Scalings, Action, Event, Degree, Flags
+from ..datatypes import Scalings, Action, Event, Degree, Flags, Positions
+from ..datatypes import Timings, Overload
+from ..profiling import profiled
+from ..checkpoint import Checkpoint
 from ...geometry import Mapper
+from .publication import Publication
+from .recorder import Recorder
 
 QUEUE = type(Queue())
 TIMEOUT: float = 1.0
+CHECKPOINT_INTERVAL: float = 60.0  # Seconds between periodic checkpoints.
+STAGES = ('receive', 'map', 'push')  # Receive includes idling.
+RETRY: float = 0.01  # Seconds between offers of a held-back snapshot.
+SAMPLING_INTERVAL: float = 0.1  # Seconds between offers when sampling.
 
 
 class DataGateParams:
     def __init__(self, degree: Degree, mapper: Mapper, event_pipe: Connection,
-                 point_queue: QUEUE) -> None:
+                 point_queue: QUEUE, publication: Publication,
+                 fan_out: list =None) -> None:
         self.__degree = self.__degree_type_checked(degree)
         self.__map = self.__mapper_type_checked(mapper)
         self.__event_pipe = self.__connection_type_checked(event_pipe)
         self.__point_queue = self.__queue_type_checked(point_queue)
+        self.__publication = self.__publication_type_checked(publication)
+        fan_out = [] if fan_out is None else fan_out
+        self.__fan_out = [(self.__queue_type_checked(queue),
+                           self.__overload_type_checked(overload))
+                          for queue, overload in fan_out]
 
     @property
     def degree(self) -> Degree:
@@ -34,6 +51,18 @@ class DataGateParams:
     def point_queue(self) -> QUEUE:
         return self.__point_queue
 
+    @property
+    def publication(self) -> Publication:
+        return self.__publication
+
+    @property
+    def point_queues(self) -> tuple:
+        return (self.__point_queue, *(queue for queue, _ in self.__fan_out))
+
+    @property
+    def fan_out_overloads(self) -> tuple:
+        return tuple(overload for _, overload in self.__fan_out)
+
     @staticmethod
     def __degree_type_checked(value: Degree) -> Degree:
         if type(value) is not Degree:
@@ -64,12 +93,37 @@ class DataGateParams:
             raise OSError('Event- and point-queues must initially be open!')
         return value
 
+    @staticmethod
+    def __publication_type_checked(value: Publication) -> Publication:
+        if type(value) is not Publication:
+            raise TypeError('Publication must be of type <Publication>!')
+        return value
+
+    @staticmethod
+    def __overload_type_checked(value: Overload) -> Overload:
+        if type(value) is not Overload:
+            raise TypeError('Overload policy must be of type <Overload>!')
+        return value
+
 
 class DataGate(Process):
-    def __init__(self, params: DataGateParams) -> None:
+    def __init__(self, params: DataGateParams, checkpoint: str =None,
+                 record: str =None,
+                 overload: Overload =Overload.BLOCK) -> None:
         super().__init__()
         self.__params = self.__params_type_checked(params)
+        self.__checkpoint = self.__path_type_checked(checkpoint)
+        self.__record = self.__path_type_checked(record)
+        self.__overload = self.__overload_type_checked(overload)
+        self.__policy_of = dict(zip(self.__params.point_queues,
+                                    (self.__overload,
+                                     *self.__params.fan_out_overloads)))
+        self.__overloaded = set()
+        self.__pending = set()
+        self.__offered = {}
+        self.__shed_snapshots = Value('l', 0)
         self.__flag = Flags()
+        self.__timings = Timings(STAGES)
         self.__degree = self.__params.degree
         self.__scale = Scalings(self.__degree)
         self.__points = DataFrame(index=('x', 'y'))
@@ -86,22 +140,66 @@ class DataGate(Process):
     def N(self) -> int:
         return self.__N.value
 
+    @property
+    def timings(self) -> Timings:
+        return self.__timings
+
+    @property
+    def overload(self) -> Overload:
+        return self.__overload
+
+    @property
+    def shed(self) -> dict:
+        return {'snapshots': self.__shed_snapshots.value}
+
+    @profiled
     def run(self) -> None:
+        if self.__checkpoint is not None and isfile(self.__checkpoint):
+            self.__restore()
+        saved = time()
+        recorder = None if self.__record is None else Recorder(self.__record)
+        tick = perf_counter()
         while True:
-            if self.__params.event_pipe.poll(timeout=TIMEOUT):
+            if self.__checkpoint is not None:
+                if time() - saved > CHECKPOINT_INTERVAL:
+                    self.__save()
+                    saved = time()
+            if recorder is not None:
+                recorder.flush_if_due()
+            timeout = RETRY if self.__pending else TIMEOUT
+            if self.__params.event_pipe.poll(timeout=timeout):
                 try:
                     item_from_pipe = self.__params.event_pipe.recv()
-                    event = self.__event_type_checked(item_from_pipe)
+                    events = self.__events_type_checked(item_from_pipe)
                 except EOFError:
                     raise EOFError('Nothing more to read from event pipe!')
                 except OSError:
                     raise OSError('Event pipe appears to be closed!')
                 else:
-                    data_changed_due_to = self.__handler_of[event.action]
-                    if data_changed_due_to(event):
-                        self.__push(self.__points.values)
-            elif self.__flag.stop.is_set():
-                break
+                    tick = self.__timings.since('receive', tick)
+                    data_changed = False
+                    for event in events:
+                        if recorder is not None:
+                            recorder.record(event, time())
+                        data_changed_due_to = self.__handler_of[event.action]
+                        data_changed = data_changed_due_to(event) or \
+                            data_changed
+                    tick = self.__timings.since('map', tick)
+                    if data_changed:
+                        self.__offer(self.__params.point_queues)
+                        tick = self.__timings.since('push', tick)
+                    elif self.__pending:
+                        self.__offer(tuple(self.__pending), retry=True)
+                        tick = self.__timings.since('push', tick)
+            else:
+                if self.__pending:
+                    self.__offer(tuple(self.__pending), retry=True)
+                if self.__flag.stop.is_set():
+                    break
+        if self.__checkpoint is not None:
+            self.__save()
+        if recorder is not None:
+            recorder.close()
         self.__params.event_pipe.close()
         self.__flag.done.set()
 
@@ -137,15 +235,86 @@ class DataGate(Process):
             return True
         return False
 
-    def __push(self, array: ndarray) -> None:
-        try:
-            self.__params.point_queue.put(array, timeout=TIMEOUT)
-        except AssertionError:
-            err_msg = ('Point queue is already closed. Instantiate a'
-                       ' new <Parallel> object to start all over!')
-            raise AssertionError(err_msg)
-        except Full:
-            raise Full('Point queue is full!')
+    def __restore(self) -> None:
+        checkpoint = Checkpoint.load(self.__checkpoint)
+        xy = checkpoint.xy
+        inside = self.__params.map.bounds.contain_many(xy)
+        ids = [uuid for uuid, keep in zip(checkpoint.ids, inside) if keep]
+        mapped = self.__params.map.in_from_many(xy[inside])
+        self.__points = DataFrame(mapped.T, index=('x', 'y'), columns=ids)
+        with self.__N.get_lock():
+            self.__N.value = len(ids)
+        self.__offer(self.__params.point_queues)
+
+    def __save(self) -> None:
+        mapped = self.__points.values.T.astype(float64)
+        checkpoint = Checkpoint(self.__params.degree,
+                                self.__params.map,
+                                self.__params.publication.snapshot.coeffs,
+                                list(self.__points.columns),
+                                self.__params.map.back_from_many(mapped))
+        checkpoint.save(self.__checkpoint)
+
+    def __offer(self, queues: tuple, retry: bool =False) -> None:
+        positions = Positions(time(), self.__points.values)
+        for queue in queues:
+            self.__offer_to(queue, positions, retry)
+
+    def __offer_to(self, queue: QUEUE, positions: Positions,
+                   retry: bool) -> None:
+        overload = self.__policy_of[queue]
+        if overload is Overload.BLOCK:
+            if not self.__push(positions, queue):
+                self.__count_shed_snapshot()
+            return
+        if queue in self.__pending and not retry:
+            self.__count_shed_snapshot()  # Held snapshot replaced by newer.
+        if self.__sampling_skips(queue, overload):
+            self.__pending.add(queue)
+            return
+        self.__offered[queue] = time()
+        if self.__push(positions, queue, block=False):
+            self.__overloaded.discard(queue)
+            self.__pending.discard(queue)
+            return
+        self.__overloaded.add(queue)
+        if overload is Overload.DROP_OLDEST:
+            try:
+                _ = queue.get_nowait()
+            except Empty:
+                pass
+            else:
+                self.__count_shed_snapshot()
+            if self.__push(positions, queue, block=False):
+                self.__pending.discard(queue)
+                return
+        self.__pending.add(queue)
+
+    def __sampling_skips(self, queue: QUEUE, overload: Overload) -> bool:
+        if overload is not Overload.SAMPLE:
+            return False
+        if queue not in self.__overloaded:
+            return False
+        return time() - self.__offered[queue] < SAMPLING_INTERVAL
+
+    def __count_shed_snapshot(self) -> None:
+        with self.__shed_snapshots.get_lock():
+            self.__shed_snapshots.value += 1
+
+    def __push(self, positions: Positions, queue: QUEUE,
+               block: bool =True) -> bool:
+        while True:
+            try:
+                queue.put(positions, block, TIMEOUT)
+            except AssertionError:
+                err_msg = ('Point queue is already closed. Instantiate a'
+                           ' new <Parallel> object to start all over!')
+                raise AssertionError(err_msg)
+            except Full:
+                if not block or self.__flag.stop.is_set():
+                    return False
+            else:
+                return True
 
     @staticmethod
     def __params_type_checked(value: DataGateParams) -> DataGateParams:
@@ -154,7 +323,20 @@ class DataGate(Process):
         return value
 
     @staticmethod
-    def __event_type_checked(value: Event) -> Event:
-        if type(value) is not Event:
-            raise TypeError('Event must be of type <Event>!')
+    def __path_type_checked(value: str) -> str:
+        if value is not None and type(value) is not str:
+            raise TypeError('Path to the checkpoint must be a string!')
         return value
+
+    @staticmethod
+    def __overload_type_checked(value: Overload) -> Overload:
+        if type(value) is not Overload:
+            raise TypeError('Overload policy must be of type <Overload>!')
+        return value
+
+    @staticmethod
+    def __events_type_checked(value) -> list:
+        events = value if type(value) is list else [value]
+        if not all(type(event) is Event for event in events):
+            raise TypeError('Event must be of type <Event>!')
+        return events
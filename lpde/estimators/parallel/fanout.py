@@ -0,0 +1,82 @@
+from ..datatypes import Degree, Overload
+from ...geometry import Mapper
+from .controller import Controller
+from .parallel import ParallelEstimator
+
+
+class FanOut:
+    def __init__(self, degrees: list, mapper: Mapper, produce_params,
+                 name: str =None) -> None:
+        self.__degrees = self.__degrees_type_checked(degrees)
+        self.__estimators = {degree: ParallelEstimator(
+            degree, mapper, produce_params, self.__name_for(name, degree))
+            for degree in self.__degrees}
+        self.__leader = self.__estimators[self.__degrees[0]].controller
+        for degree in self.__degrees[1:]:
+            self.__leader.fan_out_to(self.__estimators[degree].controller)
+
+    def __getitem__(self, degree: Degree) -> ParallelEstimator:
+        return self.__estimators[degree]
+
+    @property
+    def degrees(self) -> tuple:
+        return self.__degrees
+
+    @property
+    def estimators(self) -> tuple:
+        return tuple(self.__estimators.values())
+
+    @property
+    def leader(self) -> Controller:
+        return self.__leader
+
+    def start(self, n_jobs=1, decay: float =1.0, checkpoint: str =None,
+              record: str =None, profile: str =None,
+              overload=None) -> None:
+        n_jobs = self.__jobs_type_and_length_checked(n_jobs)
+        overloads = self.__overloads_type_and_length_checked(overload)
+        groups = zip(self.__degrees, n_jobs, overloads)
+        for degree, jobs, policy in reversed(list(groups)):
+            controller = self.__estimators[degree].controller
+            if controller is self.__leader:
+                controller.start(jobs, decay, checkpoint, record,
+                                 profile, policy)
+            else:
+                controller.start(jobs, decay, profile=profile,
+                                 overload=policy)
+
+    def stop(self) -> None:
+        self.__leader.stop()
+
+    @staticmethod
+    def __name_for(name: str, degree: Degree) -> str:
+        if name is None:
+            return None
+        return f'{name}_{degree.k_max}x{degree.l_max}'
+
+    @staticmethod
+    def __degrees_type_checked(value: list) -> tuple:
+        if not value or not all(type(degree) is Degree for degree in value):
+            raise TypeError('Degrees must be a non-empty list of <Degree>!')
+        if len(set(value)) != len(value):
+            raise ValueError('Degrees must not occur more than once!')
+        return tuple(value)
+
+    def __jobs_type_and_length_checked(self, value) -> tuple:
+        n_jobs = (value,)*len(self.__degrees) if type(value) is int else value
+        if type(n_jobs) not in (list, tuple):
+            raise TypeError('Number of jobs must be an integer or a list!')
+        if len(n_jobs) != len(self.__degrees):
+            raise ValueError('Need one number of jobs per degree!')
+        return tuple(n_jobs)
+
+    def __overloads_type_and_length_checked(self, value) -> tuple:
+        followers = (None,) * (len(self.__degrees) - 1)
+        if value is None or type(value) is Overload:
+            return (value, *followers)
+        if type(value) not in (list, tuple):
+            raise TypeError('Overload policy must be of type <Overload>'
+                            ' or a list!')
+        if len(value) != len(self.__degrees):
+            raise ValueError('Need one overload policy per degree!')
+        return tuple(value)
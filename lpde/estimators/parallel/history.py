@@ -0,0 +1,107 @@
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from numpy import ndarray, int64, float64, arange
+from ..datatypes import Degree, Snapshot
+
+HISTORY_LENGTH: int = 3600
+INTEGER_FIELDS: int = 3  # Number of entries written, capacity, and size.
+ENTRY_OFFSET: int = INTEGER_FIELDS * int64().itemsize
+ENTRY_FIELDS: int = 3  # Time, N, and version ahead of the coefficients.
+
+
+class History:
+    def __init__(self, degree: Degree, name: str,
+                 length: int =HISTORY_LENGTH) -> None:
+        degree = self.__degree_type_checked(degree)
+        name = self.__name_type_checked(name)
+        length = self.__integer_type_and_range_checked(length)
+        n_coeffs = (degree.k_max + 1) * (degree.l_max + 1)
+        size = ENTRY_OFFSET + length*(ENTRY_FIELDS + n_coeffs)*8
+        self.__memory = SharedMemory(name, create=True, size=size)
+        header = ndarray((INTEGER_FIELDS,), int64, self.__memory.buf)
+        header[:] = 0, length, n_coeffs
+        self.__map_arrays_onto_memory()
+
+    @classmethod
+    def attach(cls, name: str) -> 'History':
+        name = cls.__name_type_checked(name)
+        history = cls.__new__(cls)
+        try:
+            history.__memory = SharedMemory(name)
+        except FileNotFoundError:
+            raise FileNotFoundError(f'No history named "{name}" found!')
+        resource_tracker.unregister(history.__memory._name, 'shared_memory')
+        history.__map_arrays_onto_memory()
+        return history
+
+    def __map_arrays_onto_memory(self) -> None:
+        memory = self.__memory.buf
+        self.__header = ndarray((INTEGER_FIELDS,), int64, memory)
+        length, n_coeffs = map(int, self.__header[1:])
+        shape = (length, ENTRY_FIELDS + n_coeffs)
+        self.__entries = ndarray(shape, float64, memory, ENTRY_OFFSET)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__.attach, (self.name,)
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    @property
+    def length(self) -> int:
+        return self.__entries.shape[0]
+
+    @property
+    def count(self) -> int:
+        return int(self.__header[0])
+
+    def append(self, snapshot: Snapshot) -> None:
+        count = int(self.__header[0])
+        entry = self.__entries[count % self.length]
+        entry[:ENTRY_FIELDS] = snapshot.time, snapshot.N, snapshot.version
+        entry[ENTRY_FIELDS:] = snapshot.coeffs
+        self.__header[0] = count + 1
+
+    def between(self, start: float, stop: float) -> list:
+        count = int(self.__header[0])
+        sequence = arange(max(count - self.length, 0), count)
+        entries = self.__entries[sequence % self.length].copy()
+        overwritten = int(self.__header[0]) - self.length
+        entries = entries[sequence > overwritten]
+        times = entries[:, 0]
+        entries = entries[(start <= times) & (times <= stop)]
+        return [Snapshot(int(entry[2]), entry[0], int(entry[1]),
+                         entry[ENTRY_FIELDS:]) for entry in entries]
+
+    def at(self, moment: float) -> Snapshot:
+        earlier = self.between(float('-inf'), moment)
+        if not earlier:
+            raise ValueError('No snapshot recorded that early!')
+        return earlier[-1]
+
+    def unlink(self) -> None:
+        try:
+            self.__memory.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __degree_type_checked(value: Degree) -> Degree:
+        if type(value) is not Degree:
+            raise TypeError('Polynomial degree must be of type <Degree>!')
+        return value
+
+    @staticmethod
+    def __name_type_checked(value: str) -> str:
+        if type(value) is not str:
+            raise TypeError('Name of the history must be a string!')
+        return value
+
+    @staticmethod
+    def __integer_type_and_range_checked(value: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Length of the history must be an integer!')
+        if value < 1:
+            raise ValueError('Length of the history must be at least 1!')
+        return value
@@ -1,15 +1,18 @@
-from multiprocessing import Process, Queue
+from multiprocessing import Process, Queue, Event
 from queue import Empty, Full
+from time import perf_counter
 from numpy import zeros, square, log, ndarray, float64, array
 from numpy.polynomial.legendre import legvander2d
 from scipy.optimize import fmin_l_bfgs_b, minimize
 from ..datatypes import LagrangeCoefficients, Degree, Flags
-from ..datatypes import Scalings
+from ..datatypes import Scalings, Positions, Solution, Timings
+from ..profiling import profiled
 
 QUEUE = type(Queue())
 GRADIENT_TOLERANCE: float = 0.1
 MAXIMUM_ITERATIONS: int = 10000
 TIMEOUT: float = 1.0
+STAGES = ('receive', 'basis', 'solve', 'push')  # Receive includes idling.
 
 
 class MinimizerParams:
@@ -51,9 +54,12 @@ class Minimizer(Process):
         super().__init__()
         self.__params = self.__params_type_checked(params)
         self.__flag = Flags()
+        self.__timings = Timings(STAGES)
+        self.__retire = Event()
         self.__c_init = LagrangeCoefficients(self.__params.degree)
         self.__grad_c = zeros(self.__c_init.vector.size)
         self.__phi_ijn = array([])
+        self.__time = 0.0
         self.__scale = Scalings(self.__params.degree)
         self.__options = {'maxiter': MAXIMUM_ITERATIONS,
                           'disp': False}
@@ -65,24 +71,45 @@ class Minimizer(Process):
     def flag(self) -> Flags:
         return self.__flag
 
+    @property
+    def timings(self) -> Timings:
+        return self.__timings
+
+    @property
+    def retire(self) -> Event:
+        return self.__retire
+
+    @profiled
     def run(self) -> None:
+        tick = perf_counter()
         while True:
             try:
                 queue_item = self.__params.point_queue.get(timeout=TIMEOUT)
-                points = self.__type_and_shape_checked(queue_item)
+                positions = self.__type_and_shape_checked(queue_item)
             except OSError:
                 raise OSError('Point queue is already closed. Instantiate a'
                               ' new <Parallel> object to get going again!')
             except Empty:
-                if self.__flag.stop.is_set():
+                tick = self.__timings.since('receive', tick)
+                if self.__flag.stop.is_set() or self.__retire.is_set():
                     break
             else:
-                self.__phi_ijn = legvander2d(*points, self.__params.degree).T/\
+                tick = self.__timings.since('receive', tick)
+                self.__time = positions.time
+                self.__phi_ijn = legvander2d(*positions.xy,
+                                             self.__params.degree).T / \
                                  self.__scale.vecT
-                self.__minimize()
+                tick = self.__timings.since('basis', tick)
+                coefficients = self.__minimize()
+                tick = self.__timings.since('solve', tick)
+                if coefficients is not None:
+                    self.__push(coefficients)
+                    tick = self.__timings.since('push', tick)
+                if self.__retire.is_set():
+                    break
         self.__flag.done.set()
 
-    def __minimize(self) -> None:
+    def __minimize(self) -> ndarray:
         self.__c_init.lagrange = self.__phi_ijn.shape[1]
         coefficients, _, status = fmin_l_bfgs_b(self.__lagrangian,
                                                 self.__c_init.vector,
@@ -90,22 +117,22 @@ class Minimizer(Process):
                                                 **self.__options)
         converged = self.__grad_c.dot(self.__grad_c) < GRADIENT_TOLERANCE
         if (status['warnflag'] == 0) and converged:
-            self.__push(coefficients[1:])
-        else:
-            self.__fallback()
+            return coefficients[1:]
+        return self.__fallback()
 
-    def __fallback(self) -> None:
+    def __fallback(self) -> ndarray:
         result = minimize(self.__neg_log_l, self.__c_init.coeffs,
                           method='slsqp',
                           jac=self.__grad_neg_log_l,
                           constraints=self.__constraint,
                           options=self.__options)
-        if result.success:
-            self.__push(result.x)
+        return result.x if result.success else None
 
     def __push(self, coefficients: ndarray) -> None:
+        n_points = self.__phi_ijn.shape[-1]
+        solution = Solution(self.__time, n_points, coefficients)
         try:
-            self.__params.coeff_queue.put(coefficients, timeout=TIMEOUT)
+            self.__params.coeff_queue.put(solution, timeout=TIMEOUT)
         except AssertionError:
             err_msg = ('Coefficient queue is already closed. Instantiate'
                        ' a new <Parallel> object to get going again!')
@@ -141,14 +168,16 @@ class Minimizer(Process):
             raise TypeError('Parameters must be of type <MinimizerParams>!')
         return value
 
-    def __type_and_shape_checked(self, value: ndarray) -> ndarray:
-        if type(value) is not ndarray:
-            raise TypeError('Matrix with data points must be a numpy array!')
-        if value.shape[0] != 2:
+    def __type_and_shape_checked(self, value: Positions) -> Positions:
+        if type(value) is not Positions:
+            raise TypeError('Data points must come as type <Positions>!')
+        if value.xy.shape[0] != 2:
             raise ValueError('Dimensions of data-points matrix is wrong!'
                              f' There should be 2 rows (x and y) but'
-                             f' there are now {value.shape[0]}.')
-        if value.size == 0:
+                             f' there are now {value.xy.shape[0]}.')
+        if value.xy.size == 0:
+            self.__time = value.time
+            self.__phi_ijn = array([])
             self.__push(self.__c_init.coeffs)
             raise Empty('The data points matrix seems to be emtpy.')
         return value
@@ -1,26 +1,71 @@
-from typing import Union
-from numpy import square, ndarray, float64, frombuffer, linspace, meshgrid
-from numpy.polynomial.legendre import legval2d, legder
-from .controller import Controller
-from ..datatypes import Coefficients, Scalings, Degree
+from collections import OrderedDict
+from typing import Union, Iterator
+from numpy import square, ndarray, float64, linspace, meshgrid
+from numpy import empty, matmul, multiply, array, clip, where, pad, inf
+from numpy import sqrt, minimum, argsort, column_stack, nonzero, absolute
+from numpy import cumsum, interp, zeros, arange, maximum
+from numpy.random import Generator, default_rng
+from numpy.ma import MaskedArray, masked_array
+from numpy.polynomial.legendre import legval2d, legder, legvander
+from .controller import Controller, HISTORY_SUFFIX
+from .publication import Publication
+from .history import History
+from .cache import Cache
+from ..analytics import products, marginal, l2_distance
+from ..datatypes import Coefficients, Scalings, Degree, Snapshot
 from ...geometry import Mapper, PointAt, Grid, BoundingBox
-from ...producers import PRODUCER_TYPES
+from ...producers import PRODUCERS
 
 DEFAULT_PIXELS_Y: int = 100
+REMEMBERED_SNAPSHOTS: int = 256
+HOTSPOT_SEEDS: int = 48  # Coarse grid points per axis to seed the search.
+NEWTON_STEPS: int = 12
+STEP_TOLERANCE: float = 1e-10
+SAMPLING_NODES: int = 513  # Nodes per axis of the tabulated inverse CDFs.
+SAMPLING_CHUNK: int = 4096  # Samples drawn from conditional CDFs at once.
 NUMPY_TYPE = Union[float64, ndarray]
 
 
 class ParallelEstimator:
-    def __init__(self, degree: Degree, mapper: Mapper, produce_params) -> None:
+    def __init__(self, degree: Degree, mapper: Mapper, produce_params,
+                 name: str =None) -> None:
         self.__degree = self.__degree_type_checked(degree)
         self.__map = self.__mapper_type_checked(mapper)
         params = self.__producer_params_type_checked(produce_params)
-        self.__controller = Controller(self.__degree, self.__map, params)
+        self.__controller = Controller(self.__degree, self.__map, params, name)
+        self.__publication = self.__controller.publication
+        self.__history = self.__controller.history
+        self.__initialize()
+
+    @classmethod
+    def attach(cls, name: str) -> 'ParallelEstimator':
+        view = cls.__new__(cls)
+        view.__publication = Publication.attach(name)
+        view.__history = History.attach(name + HISTORY_SUFFIX)
+        view.__degree = view.__publication.degree
+        view.__map = view.__publication.map
+        view.__controller = None
+        view.__initialize()
+        return view
+
+    def __initialize(self) -> None:
         self.__c = Coefficients(self.__degree)
-        self.__c.vec = frombuffer(self.__controller.smooth_coeffs.get_obj())
         self.__scale = Scalings(self.__degree)
+        self.__cache = Cache()
+        self.__seen = OrderedDict()
+        self.__grid_version = 0
+        interval = array([self.__map.legendre_interval])
+        self.__x_products = products(*interval.T, self.__degree.k_max)[0]
+        self.__y_products = products(*interval.T, self.__degree.l_max)[0]
+        self.__seed_line = linspace(*self.__map.legendre_interval,
+                                    HOTSPOT_SEEDS)
+        self.__seed_cell = self.__seed_line[1] - self.__seed_line[0]
+        self.__seed_bases = (legvander(self.__seed_line, self.__degree.k_max),
+                             legvander(self.__seed_line, self.__degree.l_max))
+        self.__nodes = linspace(*self.__map.legendre_interval, SAMPLING_NODES)
+        self.__node_basis_y = legvander(self.__nodes, self.__degree.l_max)
         pixels_x = int(DEFAULT_PIXELS_Y / self.__map.bounds.aspect)
-        self.__grid = self.__make(Grid(pixels_x, DEFAULT_PIXELS_Y))
+        self.__tabulate(Grid(pixels_x, DEFAULT_PIXELS_Y))
 
     @property
     def bounds(self) -> BoundingBox:
@@ -28,24 +73,75 @@ class ParallelEstimator:
 
     @property
     def controller(self) -> Controller:
+        if self.__controller is None:
+            raise AttributeError('Read-only views have no controller!')
         return self.__controller
 
+    @property
+    def read_only(self) -> bool:
+        return self.__controller is None
+
+    @property
+    def name(self) -> str:
+        return self.__publication.name
+
+    @property
+    def version(self) -> int:
+        return self.__publication.version
+
+    @property
+    def snapshot(self) -> Snapshot:
+        return self.__publication.snapshot
+
+    @property
+    def history(self) -> History:
+        return self.__history
+
+    @property
+    def cache(self) -> dict:
+        return self.__cache.stats
+
     @property
     def grid(self) -> (ndarray, ndarray):
-        return self.__grid
+        return meshgrid(self.__x_line, self.__y_line)
 
     @grid.setter
     def grid(self, grid: Grid) -> None:
         grid = self.__grid_type_checked(grid)
-        self.__grid = self.__make(grid)
+        self.__tabulate(grid)
 
     @property
     def on_grid(self) -> ndarray:
-        return self.__density(self.__grid)
+        density = self.__cache.get('density', self.__grid_key)
+        if density is not None:
+            return density
+        snapshot, coeffs = self.__coefficients()
+        density = self.__on_grid(coeffs, empty(self.__grid_shape))
+        square(density, out=density)
+        multiply(density, self.__map.out(snapshot.N), out=density)
+        density.setflags(write=False)
+        key = (snapshot.version, snapshot.N, self.__grid_version)
+        return self.__cache.put('density', key, density)
 
     @property
     def gradient_on_grid(self) -> (ndarray, ndarray):
-        return self.__gradient(self.__grid)
+        gradient = self.__cache.get('gradient', self.__grid_key)
+        if gradient is not None:
+            return gradient
+        if 'sqrt_p' not in self.__buffers:
+            self.__buffers['sqrt_p'] = empty(self.__grid_shape)
+        snapshot, coeffs = self.__coefficients()
+        derivatives = self.__derivatives(snapshot.version, coeffs)
+        coeffs_of_grad_x, coeffs_of_grad_y = derivatives
+        sqrt_p = self.__on_grid(coeffs, self.__buffers['sqrt_p'])
+        multiply(sqrt_p, self.__map.out(2.0 * snapshot.N), out=sqrt_p)
+        gradient = (self.__on_grid(coeffs_of_grad_x, empty(self.__grid_shape)),
+                    self.__on_grid(coeffs_of_grad_y, empty(self.__grid_shape)))
+        for component in gradient:
+            multiply(sqrt_p, component, out=component)
+            component.setflags(write=False)
+        key = (snapshot.version, snapshot.N, self.__grid_version)
+        return self.__cache.put('gradient', key, gradient)
 
     def at(self, point: PointAt) -> float64:
         point = self.__point_type_checked(point)
@@ -57,24 +153,280 @@ class ParallelEstimator:
         mapped_point = self.__map.in_from(point)
         return self.__gradient(mapped_point)
 
-    def __make(self, grid: Grid) -> (ndarray, ndarray):
-        x_line = linspace(*self.__map.legendre_interval, grid.x)
-        y_line = linspace(*self.__map.legendre_interval, grid.y)
-        return meshgrid(x_line, y_line)
+    def at_many(self, xy: ndarray) -> MaskedArray:
+        outside = ~self.__map.bounds.contain_many(xy)
+        snapshot, coeffs = self.__coefficients()
+        bases = self.__bases_at(self.__map.in_from_many(xy))
+        density = square(self.__series_at(coeffs, *bases))
+        density = self.__map.out(density) * snapshot.N
+        return masked_array(density, mask=outside)
+
+    def gradient_at_many(self, xy: ndarray) -> (MaskedArray, MaskedArray):
+        outside = ~self.__map.bounds.contain_many(xy)
+        snapshot, coeffs = self.__coefficients()
+        derivatives = self.__derivatives(snapshot.version, coeffs)
+        coeffs_of_grad_x, coeffs_of_grad_y = derivatives
+        bases = self.__bases_at(self.__map.in_from_many(xy))
+        factor = 2.0 * snapshot.N * self.__series_at(coeffs, *bases)
+        grad_x = factor * self.__series_at(coeffs_of_grad_x, *bases)
+        grad_y = factor * self.__series_at(coeffs_of_grad_y, *bases)
+        return (masked_array(self.__map.out(grad_x), mask=outside),
+                masked_array(self.__map.out(grad_y), mask=outside))
+
+    def integrate(self, box: BoundingBox) -> float64:
+        box = self.__box_type_checked(box)
+        return self.integrate_many(array([box.extent]))[0]
+
+    def integrate_many(self, extents: ndarray) -> ndarray:
+        extents = self.__extents_type_and_shape_checked(extents)
+        lower = self.__map.in_from_many(extents[:, ::2])
+        upper = self.__map.in_from_many(extents[:, 1::2])
+        lower = clip(lower, *self.__map.legendre_interval)
+        upper = clip(upper, lower, self.__map.legendre_interval[1])
+        snapshot, coeffs = self.__coefficients()
+        x_products = products(lower[:, 0], upper[:, 0], self.__degree.k_max)
+        y_products = products(lower[:, 1], upper[:, 1], self.__degree.l_max)
+        integrals = (x_products @ coeffs @ y_products * coeffs).sum((1, 2))
+        return self.__map.out(integrals) * self.__map.jacobian * snapshot.N
+
+    def marginal_x(self, x: ndarray) -> ndarray:
+        x = self.__line_type_and_shape_checked(x)
+        snapshot, coeffs = self.__coefficients()
+        mapped = (x - self.bounds.center[0]) * self.__map.scale[0]
+        density = marginal(coeffs, self.__y_products, mapped)
+        return self.__map.out(density) / self.__map.scale[1] * snapshot.N
+
+    def marginal_y(self, y: ndarray) -> ndarray:
+        y = self.__line_type_and_shape_checked(y)
+        snapshot, coeffs = self.__coefficients()
+        mapped = (y - self.bounds.center[1]) * self.__map.scale[1]
+        density = marginal(coeffs.T, self.__x_products, mapped)
+        return self.__map.out(density) / self.__map.scale[0] * snapshot.N
+
+    def change_since(self, reference: Union[int, Snapshot]) -> float64:
+        if type(reference) is int:
+            reference = self.__recalled(reference)
+        snapshot, _ = self.__coefficients()
+        return l2_distance(reference, snapshot)
+
+    def snapshot_at(self, moment: float) -> Snapshot:
+        moment = self.__time_type_checked(moment)
+        return self.__history.at(moment)
+
+    def on_grid_at(self, moment: float) -> ndarray:
+        return self.__density_on_grid(self.snapshot_at(moment))
+
+    def replay(self, start: float,
+               stop: float =inf) -> Iterator[tuple]:
+        start = self.__time_type_checked(start)
+        stop = self.__time_type_checked(stop)
+        for snapshot in self.__history.between(start, stop):
+            yield snapshot, self.__density_on_grid(snapshot)
+
+    def hotspots(self, k: int =1) -> ndarray:
+        k = self.__integer_type_and_range_checked(k)
+        snapshot, coeffs = self.__coefficients()
+        xy = self.__climb(self.__seeds(snapshot.version, coeffs),
+                          snapshot.version, coeffs)
+        heights = square(self.__series_at(coeffs, *self.__bases_at(xy)))
+        order = self.__distinct(xy, heights)[:k]
+        world_xy = self.__map.back_from_many(xy[order])
+        heights = self.__map.out(heights[order]) * snapshot.N
+        return column_stack((world_xy, heights))
+
+    def sample(self, n: int, rng: Generator =None) -> ndarray:
+        n = self.__sample_size_type_and_range_checked(n)
+        rng = default_rng() if rng is None else self.__rng_type_checked(rng)
+        snapshot, coeffs = self.__coefficients()
+        x_cdf = self.__marginal_cdf(snapshot.version, coeffs)
+        x = interp(rng.random(n) * x_cdf[-1], x_cdf, self.__nodes)
+        y = empty(n)
+        for start in range(0, n, SAMPLING_CHUNK):
+            chunk = slice(start, start + SAMPLING_CHUNK)
+            y[chunk] = self.__conditional_y(x[chunk], coeffs, rng)
+        return self.__map.back_from_many(column_stack((x, y)))
+
+    def __conditional_y(self, x: ndarray, coeffs: ndarray,
+                        rng: Generator) -> ndarray:
+        basis_x = legvander(x, self.__degree.k_max)
+        sqrt_p = basis_x @ coeffs @ self.__node_basis_y.T
+        cdf = self.__cumulative(square(sqrt_p, out=sqrt_p))
+        targets = rng.random(x.size) * cdf[:, -1]
+        upper = clip((cdf < targets[:, None]).sum(axis=1),
+                     1, SAMPLING_NODES - 1)
+        rows = arange(x.size)
+        lower_cdf, upper_cdf = cdf[rows, upper-1], cdf[rows, upper]
+        fraction = (targets - lower_cdf) / maximum(upper_cdf - lower_cdf,
+                                                   1e-300)
+        step = self.__nodes[1] - self.__nodes[0]
+        return self.__nodes[upper-1] + clip(fraction, 0.0, 1.0) * step
+
+    def __marginal_cdf(self, version: int, coeffs: ndarray) -> ndarray:
+        cdf = self.__cache.get('marginal_cdf', version)
+        if cdf is None:
+            density = marginal(coeffs, self.__y_products, self.__nodes)
+            cdf = self.__cumulative(density[None, :])[0]
+            self.__cache.put('marginal_cdf', version, cdf)
+        return cdf
+
+    def __cumulative(self, density: ndarray) -> ndarray:
+        step = self.__nodes[1] - self.__nodes[0]
+        cdf = zeros(density.shape)
+        cumsum((density[:, 1:] + density[:, :-1]) * step/2.0, axis=1,
+               out=cdf[:, 1:])
+        return cdf
+
+    def __seeds(self, version: int, coeffs: ndarray) -> ndarray:
+        seeds = self.__cache.get('seeds', version)
+        if seeds is None:
+            basis_x, basis_y = self.__seed_bases
+            coarse = absolute(basis_y @ coeffs.T @ basis_x.T)
+            padded = pad(coarse, 1, constant_values=-inf)
+            peaks = coarse > 0.0
+            for dy in range(3):
+                for dx in range(3):
+                    if dx != 1 or dy != 1:
+                        neighbour = padded[dy:dy+HOTSPOT_SEEDS,
+                                           dx:dx+HOTSPOT_SEEDS]
+                        peaks &= coarse >= neighbour
+            rows, columns = nonzero(peaks)
+            seeds = column_stack((self.__seed_line[columns],
+                                  self.__seed_line[rows]))
+            self.__cache.put('seeds', version, seeds)
+        return seeds
+
+    def __climb(self, xy: ndarray, version: int, coeffs: ndarray) -> ndarray:
+        first = self.__derivatives(version, coeffs)
+        second = self.__curvatures(version, first)
+        for _ in range(NEWTON_STEPS):
+            bases = self.__bases_at(xy)
+            f = self.__series_at(coeffs, *bases)
+            f_x, f_y = (self.__series_at(c, *bases) for c in first)
+            f_xx, f_xy, f_yy = (self.__series_at(c, *bases) for c in second)
+            g_x, g_y = 2.0*f*f_x, 2.0*f*f_y
+            h_xx = 2.0 * (f_x*f_x + f*f_xx)
+            h_xy = 2.0 * (f_x*f_y + f*f_xy)
+            h_yy = 2.0 * (f_y*f_y + f*f_yy)
+            det = h_xx*h_yy - h_xy*h_xy
+            concave = (h_xx < 0.0) & (det > 0.0)
+            det = where(concave, det, 1.0)
+            g_norm = where(concave, 1.0, sqrt(g_x*g_x + g_y*g_y) + 1e-300)
+            newton_x = -(h_yy*g_x - h_xy*g_y) / det
+            newton_y = -(h_xx*g_y - h_xy*g_x) / det
+            step = column_stack((
+                where(concave, newton_x, 0.5*self.__seed_cell*g_x/g_norm),
+                where(concave, newton_y, 0.5*self.__seed_cell*g_y/g_norm)))
+            length = sqrt((step*step).sum(axis=1)) + 1e-300
+            step *= minimum(1.0, self.__seed_cell/length)[:, None]
+            xy = clip(xy + step, *self.__map.legendre_interval)
+            if length.size == 0 or length.max() < STEP_TOLERANCE:
+                break
+        return xy
+
+    def __distinct(self, xy: ndarray, heights: ndarray) -> list:
+        distinct = []
+        for index in argsort(heights)[::-1]:
+            distances = absolute(xy[distinct] - xy[index]).max(axis=1)
+            if not (distances < 0.5*self.__seed_cell).any():
+                distinct.append(index)
+        return distinct
+
+    def __curvatures(self, version: int,
+                     derivatives: (ndarray, ndarray)) -> (ndarray, ...):
+        curvatures = self.__cache.get('curvatures', version)
+        if curvatures is None:
+            coeffs_of_grad_x, coeffs_of_grad_y = derivatives
+            curvatures = (legder(coeffs_of_grad_x, axis=0),
+                          legder(coeffs_of_grad_x, axis=1),
+                          legder(coeffs_of_grad_y, axis=1))
+            self.__cache.put('curvatures', version, curvatures)
+        return curvatures
+
+    def __tabulate(self, grid: Grid) -> None:
+        self.__x_line = linspace(*self.__map.legendre_interval, grid.x)
+        self.__y_line = linspace(*self.__map.legendre_interval, grid.y)
+        self.__basis_x = legvander(self.__x_line, self.__degree.k_max)
+        self.__basis_y = legvander(self.__y_line, self.__degree.l_max)
+        self.__grid_shape = (grid.y, grid.x)
+        self.__buffers = {'half': empty((self.__degree.l_max + 1, grid.x))}
+        self.__grid_version += 1
+        self.__cache.clear('density', 'gradient')
+
+    @property
+    def __grid_key(self) -> (int, int, int):
+        return (self.__publication.version,
+                self.__publication.N,
+                self.__grid_version)
+
+    def __on_grid(self, coeffs: ndarray, out: ndarray) -> ndarray:
+        k, l = coeffs.shape
+        half = self.__buffers['half'][:l]
+        matmul(coeffs.T, self.__basis_x[:, :k].T, out=half)
+        return matmul(self.__basis_y[:, :l], half, out=out)
+
+    def __density_on_grid(self, snapshot: Snapshot) -> ndarray:
+        self.__c.vec = snapshot.coeffs
+        coeffs = self.__c.mat / self.__scale.mat
+        density = self.__on_grid(coeffs, empty(self.__grid_shape))
+        square(density, out=density)
+        return multiply(density, self.__map.out(snapshot.N), out=density)
+
+    def __bases_at(self, mapped_xy: ndarray) -> (ndarray, ndarray):
+        return (legvander(mapped_xy[:, 0], self.__degree.k_max),
+                legvander(mapped_xy[:, 1], self.__degree.l_max))
+
+    @staticmethod
+    def __series_at(coeffs: ndarray, basis_x: ndarray,
+                    basis_y: ndarray) -> ndarray:
+        k, l = coeffs.shape
+        return (matmul(basis_x[:, :k], coeffs) * basis_y[:, :l]).sum(axis=1)
 
     def __density(self, point_grid: NUMPY_TYPE) -> NUMPY_TYPE:
-        density = square(legval2d(*point_grid, self.__c.mat/self.__scale.mat))
-        return self.__map.out(density) * self.__controller.N
+        snapshot, coeffs = self.__coefficients()
+        density = square(legval2d(*point_grid, coeffs))
+        return self.__map.out(density) * snapshot.N
 
     def __gradient(self, point_grid: ndarray) -> (NUMPY_TYPE, NUMPY_TYPE):
-        coeffs_of_grad_x = legder(self.__c.mat / self.__scale.mat, axis=0)
-        coeffs_of_grad_y = legder(self.__c.mat / self.__scale.mat, axis=1)
-        sqrt_p = legval2d(*point_grid, self.__c.mat/self.__scale.mat)
-        factor = 2.0 * self.__controller.N
+        snapshot, coeffs = self.__coefficients()
+        derivatives = self.__derivatives(snapshot.version, coeffs)
+        coeffs_of_grad_x, coeffs_of_grad_y = derivatives
+        sqrt_p = legval2d(*point_grid, coeffs)
+        factor = 2.0 * snapshot.N
         grad_x = factor * sqrt_p * legval2d(*point_grid, coeffs_of_grad_x)
         grad_y = factor * sqrt_p * legval2d(*point_grid, coeffs_of_grad_y)
         return self.__map.out(grad_x), self.__map.out(grad_y)
 
+    def __coefficients(self) -> (Snapshot, ndarray):
+        snapshot = self.__publication.snapshot
+        coeffs = self.__cache.get('coefficients', snapshot.version)
+        if coeffs is None:
+            self.__remember(snapshot)
+            self.__c.vec = snapshot.coeffs
+            coeffs = self.__cache.put('coefficients', snapshot.version,
+                                      self.__c.mat / self.__scale.mat)
+        return snapshot, coeffs
+
+    def __remember(self, snapshot: Snapshot) -> None:
+        self.__seen[snapshot.version] = snapshot
+        if len(self.__seen) > REMEMBERED_SNAPSHOTS:
+            _ = self.__seen.popitem(last=False)
+
+    def __recalled(self, version: int) -> Snapshot:
+        if version in self.__seen:
+            return self.__seen[version]
+        for snapshot in reversed(self.__history.between(-inf, inf)):
+            if snapshot.version == version:
+                return snapshot
+        raise ValueError(f'Version {version} has not been seen!')
+
+    def __derivatives(self, version: int,
+                      coeffs: ndarray) -> (ndarray, ndarray):
+        derivatives = self.__cache.get('derivatives', version)
+        if derivatives is None:
+            derivatives = (legder(coeffs, axis=0), legder(coeffs, axis=1))
+            self.__cache.put('derivatives', version, derivatives)
+        return derivatives
+
     @staticmethod
     def __degree_type_checked(value: Degree) -> Degree:
         if type(value) is not Degree:
@@ -89,8 +441,8 @@ class ParallelEstimator:
 
     @staticmethod
     def __producer_params_type_checked(value):
-        if type(value) not in PRODUCER_TYPES:
-            err_msg = 'Type of producer parameters must be in PRODUCER_TYPES!'
+        if type(value) not in PRODUCERS:
+            err_msg = 'Type of producer parameters must be in PRODUCERS!'
             raise TypeError(err_msg)
         return value
 
@@ -100,6 +452,56 @@ class ParallelEstimator:
             raise TypeError('Point must be of type <PointAt>!')
         return value
 
+    @staticmethod
+    def __box_type_checked(value: BoundingBox) -> BoundingBox:
+        if type(value) is not BoundingBox:
+            raise TypeError('Box must be of type <BoundingBox>!')
+        return value
+
+    @staticmethod
+    def __extents_type_and_shape_checked(value: ndarray) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Box extents must be given as a numpy array!')
+        if value.ndim != 2 or value.shape[1] != 4:
+            raise ValueError('Array of box extents must have shape (M, 4)!')
+        return value
+
+    @staticmethod
+    def __line_type_and_shape_checked(value: ndarray) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Coordinates must be given as a numpy array!')
+        if value.ndim != 1:
+            raise ValueError('Array of coordinates must be 1-dimensional!')
+        return value
+
+    @staticmethod
+    def __integer_type_and_range_checked(value: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Number of hotspots must be an integer!')
+        if value < 1:
+            raise ValueError('Number of hotspots must be at least 1!')
+        return value
+
+    @staticmethod
+    def __sample_size_type_and_range_checked(value: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Number of samples must be an integer!')
+        if value < 0:
+            raise ValueError('Number of samples must not be negative!')
+        return value
+
+    @staticmethod
+    def __rng_type_checked(value: Generator) -> Generator:
+        if type(value) is not Generator:
+            raise TypeError('Random number generator must be a <Generator>!')
+        return value
+
+    @staticmethod
+    def __time_type_checked(value: float) -> float:
+        if type(value) not in (int, float, float64):
+            raise TypeError('Time stamps must be numbers!')
+        return float(value)
+
     @staticmethod
     def __grid_type_checked(value: Grid) -> Grid:
         if type(value) is not Grid:
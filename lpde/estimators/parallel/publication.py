@@ -0,0 +1,132 @@
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from time import time, sleep
+from numpy import ndarray, int64, float64
+from ..datatypes import Degree, Coefficients, Snapshot
+from ...geometry import Mapper, BoundingBox, PointAt, Window, WidthOf
+
+INTEGER_FIELDS: int = 4  # Sequence number, N, k_max, and l_max.
+FLOAT_FIELDS: int = 6  # Time, center x and y, window x and y, and width.
+FLOAT_OFFSET: int = INTEGER_FIELDS * int64().itemsize
+COEFF_OFFSET: int = FLOAT_OFFSET + FLOAT_FIELDS * float64().itemsize
+SPINS: int = 100  # Retries that merely yield before backing off.
+BACKOFF: float = 0.0001  # Seconds to sleep between later retries.
+MAX_READS: int = 10100  # Give up after roughly a second of torn reads.
+
+
+class Publication:
+    def __init__(self, degree: Degree, mapper: Mapper, name: str =None):
+        degree = self.__degree_type_checked(degree)
+        mapper = self.__mapper_type_checked(mapper)
+        name = self.__name_type_checked(name)
+        coefficients = Coefficients(degree)
+        size = COEFF_OFFSET + coefficients.vec.nbytes
+        self.__memory = SharedMemory(name, create=True, size=size)
+        self.__map_arrays_onto_memory(coefficients.vec.size)
+        self.__integers[:] = 0, 0, degree.k_max, degree.l_max
+        self.__floats[:] = (time(),
+                            *mapper.bounds.center,
+                            *mapper.bounds.window,
+                            2.0 * mapper.legendre_interval[1])
+        self.__coeffs[:] = coefficients.vec
+        self.__unpack_header()
+
+    @classmethod
+    def attach(cls, name: str) -> 'Publication':
+        if type(name) is not str:
+            raise TypeError('Name of the publication must be a string!')
+        publication = cls.__new__(cls)
+        publication.__attach_to(name)
+        return publication
+
+    def __attach_to(self, name: str) -> None:
+        try:
+            self.__memory = SharedMemory(name)
+        except FileNotFoundError:
+            raise FileNotFoundError(f'No publication named "{name}" found!')
+        resource_tracker.unregister(self.__memory._name, 'shared_memory')
+        header = ndarray((INTEGER_FIELDS,), int64, self.__memory.buf)
+        n_coeffs = int((header[2] + 1) * (header[3] + 1))
+        self.__map_arrays_onto_memory(n_coeffs)
+        self.__unpack_header()
+
+    def __map_arrays_onto_memory(self, n_coeffs: int) -> None:
+        memory = self.__memory.buf
+        self.__integers = ndarray((INTEGER_FIELDS,), int64, memory, 0)
+        self.__floats = ndarray((FLOAT_FIELDS,), float64, memory, FLOAT_OFFSET)
+        self.__coeffs = ndarray((n_coeffs,), float64, memory, COEFF_OFFSET)
+
+    def __unpack_header(self) -> None:
+        self.__degree = Degree(*map(int, self.__integers[2:]))
+        center = PointAt(*self.__floats[1:3])
+        window = Window(*self.__floats[3:5])
+        bounds = BoundingBox(center, window)
+        self.__map = Mapper(bounds, WidthOf(self.__floats[5]))
+
+    def __reduce__(self) -> tuple:
+        return self.__class__.attach, (self.name,)
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    @property
+    def degree(self) -> Degree:
+        return self.__degree
+
+    @property
+    def map(self) -> Mapper:
+        return self.__map
+
+    @property
+    def version(self) -> int:
+        return int(self.__integers[0]) // 2
+
+    @property
+    def N(self) -> int:
+        return int(self.__integers[1])
+
+    @property
+    def snapshot(self) -> Snapshot:
+        for attempt in range(MAX_READS):
+            sequence = int(self.__integers[0])
+            if not sequence % 2:
+                coeffs = self.__coeffs.copy()
+                stamp = float(self.__floats[0])
+                n_points = int(self.__integers[1])
+                if int(self.__integers[0]) == sequence:
+                    return Snapshot(sequence // 2, stamp, n_points, coeffs)
+            sleep(0 if attempt < SPINS else BACKOFF)
+        raise RuntimeError(f'Publication "{self.name}" is stuck mid-write!')
+
+    def publish(self, coeffs: ndarray, N: int =None) -> None:
+        self.__integers[0] += 1
+        self.__coeffs[:] = coeffs
+        if N is not None:
+            self.__integers[1] = N
+        self.__floats[0] = time()
+        self.__integers[0] += 1
+
+    def unlink(self) -> None:
+        try:
+            self.__memory.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __degree_type_checked(value: Degree) -> Degree:
+        if type(value) is not Degree:
+            raise TypeError('Polynomial degree must be of type <Degree>!')
+        return value
+
+    @staticmethod
+    def __mapper_type_checked(value: Mapper) -> Mapper:
+        if type(value) is not Mapper:
+            raise TypeError('Type of mapper must be <Mapper>!')
+        return value
+
+    @staticmethod
+    def __name_type_checked(value: str) -> str:
+        if value is not None and type(value) is not str:
+            raise TypeError('Name of the publication must be a string!')
+        return value
@@ -0,0 +1,96 @@
+from os.path import getsize
+from time import time
+from numpy import dtype, float64, int64, uint8, empty, memmap, searchsorted
+from numpy import ndarray, fromfile, frombuffer, nan
+from ..datatypes import Event, EVENT_RECORD
+
+BUFFER_SIZE: int = 4096  # Events buffered in memory between bulk writes.
+FLUSH_INTERVAL: float = 1.0  # Maximal seconds events wait in the buffer.
+INDEX_SUFFIX: str = '.index'
+INDEX_RECORD = dtype([('time', float64), ('offset', int64)])
+
+
+class Recorder:
+    def __init__(self, path: str, buffer_size: int =BUFFER_SIZE) -> None:
+        self.__path = self.__path_type_checked(path)
+        buffer_size = self.__integer_type_and_range_checked(buffer_size)
+        self.__log = open(self.__path, 'ab')
+        self.__index = open(self.__path + INDEX_SUFFIX, 'ab')
+        self.__offset = self.__log.tell() // EVENT_RECORD.itemsize
+        self.__buffer = empty(buffer_size, EVENT_RECORD)
+        self.__entry = empty(1, INDEX_RECORD)
+        self.__n_buffered = 0
+        self.__flushed = time()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def count(self) -> int:
+        return self.__offset + self.__n_buffered
+
+    def record(self, event: Event, moment: float) -> None:
+        row = self.__buffer[self.__n_buffered]
+        row['time'] = moment
+        row['id'] = frombuffer(event.id.bytes, uint8)
+        row['action'] = event.action.value
+        if event.location is None:
+            row['x'], row['y'] = nan, nan
+        else:
+            row['x'], row['y'] = event.location.position
+        self.__n_buffered += 1
+        if self.__n_buffered == self.__buffer.size:
+            self.flush()
+
+    def flush_if_due(self) -> None:
+        if time() - self.__flushed > FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        self.__flushed = time()
+        if not self.__n_buffered:
+            return
+        block = self.__buffer[:self.__n_buffered]
+        self.__entry['time'] = block['time'][0]
+        self.__entry['offset'] = self.__offset
+        self.__log.write(block.tobytes())
+        self.__index.write(self.__entry.tobytes())
+        self.__log.flush()
+        self.__index.flush()
+        self.__offset += self.__n_buffered
+        self.__n_buffered = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.__log.close()
+        self.__index.close()
+
+    @staticmethod
+    def __path_type_checked(value: str) -> str:
+        if type(value) is not str:
+            raise TypeError('Path to the event log must be a string!')
+        return value
+
+    @staticmethod
+    def __integer_type_and_range_checked(value: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Buffer size must be an integer!')
+        if value < 1:
+            raise ValueError('Buffer size must be at least 1!')
+        return value
+
+
+def recorded(path: str, start: float =-float('inf'),
+             stop: float =float('inf')) -> ndarray:
+    if not getsize(path):
+        return empty(0, EVENT_RECORD)
+    events = memmap(path, EVENT_RECORD, 'r')
+    index = fromfile(path + INDEX_SUFFIX, INDEX_RECORD)
+    first = searchsorted(index['time'], start, 'right') - 1
+    last = searchsorted(index['time'], stop, 'right')
+    lower = index['offset'][first] if first > 0 else 0
+    upper = index['offset'][last] if last < index.size else events.size
+    events = events[lower:upper]
+    times = events['time']
+    return events[(start <= times) & (times <= stop)]
@@ -1,18 +1,30 @@
 from multiprocessing import Process, Queue, Array
+from operator import attrgetter
 from queue import Empty
-from numpy import frombuffer, exp, ndarray, float64
-from time import perf_counter
-from ..datatypes import Flags
+from numpy import frombuffer, exp, ndarray, float64, absolute
+from time import time, perf_counter
+from ..datatypes import Flags, Solution, Snapshot, Timings
+from ..profiling import profiled
+from .publication import Publication
+from .history import History
 
 QUEUE = type(Queue())
 ARRAY = type(Array('d', 10))
 STOP: float = 1  # Queue-get timeout in seconds for process termination.
+TICK: float = 0.01  # Queue-get timeout in seconds between publications.
+MAXIMAL_BATCH_SIZE: int = 1000  # Solutions drained from the queue per tick.
+RESOLUTION: float = 1e-6  # Smallest change in coefficients worth publishing.
+HISTORY_INTERVAL: float = 1.0  # Minimal time in seconds between records.
+STAGES = ('receive', 'blend', 'publish')  # Receive includes idling.
 
 
 class SmootherParams():
-    def __init__(self, coeff_queue: QUEUE, smooth_coeffs: ARRAY) -> None:
+    def __init__(self, coeff_queue: QUEUE, smooth_coeffs: ARRAY,
+                 publication: Publication, history: History) -> None:
         self.__coeff_queue = self.__queue_type_checked(coeff_queue)
         self.__smooth_coeffs = self.__array_type_checked(smooth_coeffs)
+        self.__publication = self.__publication_type_checked(publication)
+        self.__history = self.__history_type_checked(history)
 
     @property
     def coeff_queue(self) -> QUEUE:
@@ -22,6 +34,14 @@ class SmootherParams():
     def smooth_coeffs(self) -> ARRAY:
         return self.__smooth_coeffs
 
+    @property
+    def publication(self) -> Publication:
+        return self.__publication
+
+    @property
+    def history(self) -> History:
+        return self.__history
+
     @staticmethod
     def __queue_type_checked(value: QUEUE) -> QUEUE:
         if type(value) is not QUEUE:
@@ -36,6 +56,18 @@ class SmootherParams():
             raise TypeError('Smooth coefficients must be a shared Array!')
         return value
 
+    @staticmethod
+    def __publication_type_checked(value: Publication) -> Publication:
+        if type(value) is not Publication:
+            raise TypeError('Publication must be of type <Publication>!')
+        return value
+
+    @staticmethod
+    def __history_type_checked(value: History) -> History:
+        if type(value) is not History:
+            raise TypeError('History must be of type <History>!')
+        return value
+
 
 class Smoother(Process):
     def __init__(self, params: SmootherParams, decay: float) -> None:
@@ -43,6 +75,7 @@ class Smoother(Process):
         self.__params = self.__params_type_checked(params)
         self.__decay = self.__float_type_and_range_checked(decay)
         self.__flag = Flags()
+        self.__timings = Timings(STAGES)
         self.__init = frombuffer(self.__params.smooth_coeffs.get_obj()).copy()
         self.__shape = self.__init.shape
 
@@ -50,28 +83,70 @@ class Smoother(Process):
     def flag(self) -> Flags:
         return self.__flag
 
+    @property
+    def timings(self) -> Timings:
+        return self.__timings
+
+    @profiled
     def run(self) -> None:
+        tick = perf_counter()
+        latest = time()
+        recorded = float('-inf')
+        n_points = 0
         raw_coeffs = self.__init.copy()
         smooth_coeffs = self.__init.copy()
+        published = self.__init.copy()
         while True:
-            block = self.__flag.stop.is_set()
-            start_time = perf_counter()
-            try:
-                item = self.__params.coeff_queue.get(block=block, timeout=STOP)
-                raw_coeffs = self.__type_and_shape_checked(item)
-            except OSError:
-                raise OSError('Coefficient queue has been closed. Instantiate'
-                              ' a new <Parallel> object to get going again!')
-            except Empty:
-                if self.__flag.stop.is_set():
-                    break
-            time_difference = perf_counter() - start_time
-            damping = 1.0 - exp(-time_difference / self.__decay)
-            smooth_coeffs = damping*raw_coeffs + (1.0-damping)*smooth_coeffs
-            with self.__params.smooth_coeffs.get_lock():
-                self.__params.smooth_coeffs.get_obj()[:] = smooth_coeffs
+            solutions = self.__drain()
+            tick = self.__timings.since('receive', tick)
+            if not solutions and self.__flag.stop.is_set():
+                break
+            for solution in sorted(solutions, key=attrgetter('time')):
+                if solution.time < latest:
+                    continue
+                smooth_coeffs = self.__relax(smooth_coeffs, raw_coeffs,
+                                             solution.time - latest)
+                raw_coeffs = solution.coeffs
+                latest = solution.time
+                n_points = solution.N
+            now = time()
+            current = self.__relax(smooth_coeffs, raw_coeffs, now - latest)
+            tick = self.__timings.since('blend', tick)
+            moved = absolute(current - published).max() > RESOLUTION
+            if moved or n_points != self.__params.publication.N:
+                published = current
+                with self.__params.smooth_coeffs.get_lock():
+                    self.__params.smooth_coeffs.get_obj()[:] = published
+                self.__params.publication.publish(published, n_points)
+            if now - recorded >= HISTORY_INTERVAL:
+                recorded = now
+                version = self.__params.publication.version
+                snapshot = Snapshot(version, now, n_points, published)
+                self.__params.history.append(snapshot)
+            tick = self.__timings.since('publish', tick)
         self.__flag.done.set()
 
+    def __drain(self) -> list:
+        timeout = STOP if self.__flag.stop.is_set() else TICK
+        solutions = []
+        try:
+            item = self.__params.coeff_queue.get(timeout=timeout)
+            solutions.append(self.__type_and_shape_checked(item))
+            while len(solutions) < MAXIMAL_BATCH_SIZE:
+                item = self.__params.coeff_queue.get_nowait()
+                solutions.append(self.__type_and_shape_checked(item))
+        except OSError:
+            raise OSError('Coefficient queue has been closed. Instantiate'
+                          ' a new <Parallel> object to get going again!')
+        except Empty:
+            pass
+        return solutions
+
+    def __relax(self, smooth: ndarray, raw: ndarray,
+                interval: float) -> ndarray:
+        damping = 1.0 - exp(-max(interval, 0.0) / self.__decay)
+        return damping*raw + (1.0-damping)*smooth
+
     @staticmethod
     def __params_type_checked(value: SmootherParams) -> SmootherParams:
         if not type(value) is SmootherParams:
@@ -86,10 +161,11 @@ class Smoother(Process):
             raise ValueError('Decay constant must be positive !')
         return value
 
-    def __type_and_shape_checked(self, value: ndarray) -> ndarray:
-        if type(value) is not ndarray:
-            raise TypeError('Coefficients must be numpy array!')
-        if value.shape != self.__shape:
+    def __type_and_shape_checked(self, value: Solution) -> Solution:
+        if type(value) is not Solution:
+            raise TypeError('Coefficients must come as type <Solution>!')
+        if value.coeffs.shape != self.__shape:
             raise ValueError('Read coefficient array with wrong shape! Should'
-                             f' be {self.__shape}, but is now {value.shape}.')
+                             f' be {self.__shape}, but is now'
+                             f' {value.coeffs.shape}.')
         return value
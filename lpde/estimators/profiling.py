@@ -0,0 +1,31 @@
+from cProfile import Profile
+from functools import wraps
+from multiprocessing import Process
+from os import getpid
+from os.path import join
+from typing import Callable
+
+PROFILE_ATTRIBUTE: str = '_profile_directory'
+PROFILE_SUFFIX: str = '.prof'
+
+
+def profiled(run: Callable) -> Callable:
+    @wraps(run)
+    def run_maybe_profiled(process: Process) -> None:
+        directory = getattr(process, PROFILE_ATTRIBUTE, None)
+        if directory is None:
+            return run(process)
+        profile = Profile()
+        try:
+            profile.runcall(run, process)
+        finally:
+            name = f'{process.name}-{getpid()}{PROFILE_SUFFIX}'
+            profile.dump_stats(join(directory, name))
+    return run_maybe_profiled
+
+
+def profile_into(process: Process, directory: str) -> Process:
+    if process.pid is not None:
+        raise RuntimeError('Profiling must be enabled before start!')
+    setattr(process, PROFILE_ATTRIBUTE, directory)
+    return process
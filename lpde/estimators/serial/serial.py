@@ -1,24 +1,35 @@
+from uuid import UUID
 from numpy import zeros, square, log, ndarray, float64, linspace, meshgrid
-from numpy.polynomial.legendre import legvander2d, legval2d
+from numpy import empty
+from numpy.ma import MaskedArray, masked_array
+from numpy.polynomial.legendre import legvander2d, legval2d, legvander
 from scipy.optimize import fmin_l_bfgs_b, minimize
 from pandas import DataFrame
 from ...geometry import Mapper, PointAt, Grid
 from ..datatypes import Coefficients, LagrangeCoefficients
 from ..datatypes import Scalings, Event, Degree, Action
+from ..checkpoint import Checkpoint
 
 GRADIENT_TOLERANCE: float = 0.1
 MAXIMUM_ITERATIONS: int = 10000
+INITIAL_CAPACITY: int = 1024  # Points the basis store can hold up front.
 
 
 class SerialEstimator:
-    def __init__(self, degree: Degree, mapper: Mapper) -> None:
+    def __init__(self, degree: Degree, mapper: Mapper,
+                 lazy: bool =False) -> None:
         self.__degree = self.__degree_type_checked(degree)
         self.__map = self.__mapper_type_checked(mapper)
+        self.__lazy = self.__boolean_type_checked(lazy)
+        self.__dirty = False
         self.__c_init = LagrangeCoefficients(self.__degree)
         self.__c = Coefficients(self.__degree)
         self.__grad_c = zeros(self.__c_init.vector.size)
         self.__scale = Scalings(self.__degree)
-        self.__phi_ijn = DataFrame(index=range(self.__c.mat.size))
+        self.__phi_ijn = empty((INITIAL_CAPACITY, self.__c.vec.size))
+        self.__xy = empty((INITIAL_CAPACITY, 2))
+        self.__slot_of = {}
+        self.__id_at = []
         self.__handler_of = {Action.ADD: self.__add,
                              Action.MOVE: self.__move,
                              Action.DELETE: self.__delete}
@@ -33,22 +44,121 @@ class SerialEstimator:
 
     def at(self, point: PointAt) -> float64:
         point = self.__point_type_checked(point)
+        self.__refit_if_dirty()
         mapped_point = self.__map.in_from(point)
         p = square(legval2d(*mapped_point, self.__c.mat/self.__scale.mat))
         return self.__map.out(p * self.__N)
 
+    def at_many(self, xy: ndarray) -> MaskedArray:
+        outside = ~self.__map.bounds.contain_many(xy)
+        self.__refit_if_dirty()
+        mapped_xy = self.__map.in_from_many(xy)
+        basis_x = legvander(mapped_xy[:, 0], self.__degree.k_max)
+        basis_y = legvander(mapped_xy[:, 1], self.__degree.l_max)
+        sqrt_p = (basis_x.dot(self.__c.mat/self.__scale.mat)*basis_y).sum(1)
+        p = self.__map.out(square(sqrt_p) * self.__N)
+        return masked_array(p, mask=outside)
+
     def on(self, grid: Grid) -> ndarray:
         grid = self.__grid_type_checked(grid)
+        self.__refit_if_dirty()
         x_line = linspace(*self.__map.legendre_interval, grid.x)
         y_line = linspace(*self.__map.legendre_interval, grid.y)
         x_grid, y_grid = meshgrid(x_line, y_line)
         return square(legval2d(x_grid, y_grid, self.__c.mat/self.__scale.mat))
 
+    @property
+    def lazy(self) -> bool:
+        return self.__lazy
+
+    @property
+    def dirty(self) -> bool:
+        return self.__dirty
+
     def update_with(self, event: Event) -> None:
         event = self.__event_type_checked(event)
         data_changed_due_to = self.__handler_of[event.action]
-        if not data_changed_due_to(event):
-            return
+        if data_changed_due_to(event):
+            self.__data_changed()
+
+    def update_with_many(self, events) -> None:
+        data_changed = False
+        for event in events:
+            event = self.__event_type_checked(event)
+            data_changed_due_to = self.__handler_of[event.action]
+            data_changed = data_changed_due_to(event) or data_changed
+        if data_changed:
+            self.__data_changed()
+
+    def update_with_arrays(self, ids: list, actions: ndarray,
+                           xy: ndarray) -> None:
+        ids, actions, xy = self.__arrays_type_and_shape_checked(ids,
+                                                                actions, xy)
+        inside = self.__map.bounds.contain_many(xy)
+        mapped = self.__map.in_from_many(xy)
+        bases = legvander2d(*mapped.T, self.__degree) / self.__scale.vec
+        data_changed = False
+        for uuid, action, basis, location, keep in zip(ids, actions, bases,
+                                                       xy, inside):
+            if action == Action.DELETE.value:
+                changed = self.__delete_row(uuid)
+            elif not keep:
+                changed = False
+            elif action == Action.ADD.value:
+                changed = self.__add_row(uuid, basis, location)
+            else:
+                changed = self.__move_row(uuid, basis, location)
+            data_changed = changed or data_changed
+        if data_changed:
+            self.__data_changed()
+
+    def save(self, path: str) -> None:
+        self.__refit_if_dirty()
+        checkpoint = Checkpoint(self.__degree, self.__map, self.__c.vec,
+                                self.__id_at, self.__xy[:self.__N])
+        checkpoint.save(path)
+
+    def load(self, path: str) -> None:
+        checkpoint = Checkpoint.load(path)
+        xy = checkpoint.xy
+        inside = self.__map.bounds.contain_many(xy)
+        ids = [uuid for uuid, keep in zip(checkpoint.ids, inside) if keep]
+        self.__N = len(ids)
+        self.__slot_of = {uuid: slot for slot, uuid in enumerate(ids)}
+        self.__id_at = ids
+        capacity = max(INITIAL_CAPACITY, 2 * self.__N)
+        self.__xy = empty((capacity, 2))
+        self.__xy[:self.__N] = xy[inside]
+        mapped = self.__map.in_from_many(self.__xy[:self.__N])
+        self.__phi_ijn = empty((capacity, self.__c.vec.size))
+        if self.__N:
+            self.__phi_ijn[:self.__N] = (legvander2d(*mapped.T,
+                                                     self.__degree) /
+                                         self.__scale.vec)
+        if checkpoint.fits(self.__degree, self.__map) and inside.all():
+            self.__c.vec = checkpoint.coeffs.copy()
+            self.__dirty = False
+        elif self.__N:
+            self.__data_changed()
+        else:
+            self.__c = Coefficients(self.__degree)
+            self.__dirty = False
+
+    def refit(self) -> None:
+        self.__dirty = False
+        self.__solve()
+
+    def __data_changed(self) -> None:
+        if self.__lazy:
+            self.__dirty = True
+        else:
+            self.__solve()
+
+    def __refit_if_dirty(self) -> None:
+        if self.__dirty:
+            self.refit()
+
+    def __solve(self) -> None:
         self.__c_init.lagrange = self.__N
         coefficients, _, status = fmin_l_bfgs_b(self.__lagrangian,
                                                 self.__c_init.vector,
@@ -70,47 +180,78 @@ class SerialEstimator:
                 self._number_of_failures += 1
 
     def __add(self, event: Event) -> bool:
-        if event.id not in self.__phi_ijn.columns:
-            location = self.__map.in_from(event.location)
-            phi_ijn = legvander2d(*location, self.__degree)[0]/self.__scale.vec
-            self.__phi_ijn.loc[:, event.id] = phi_ijn
+        basis = self.__basis_at(event.location)
+        return self.__add_row(event.id, basis, event.location.position)
+
+    def __move(self, event: Event) -> bool:
+        basis = self.__basis_at(event.location)
+        return self.__move_row(event.id, basis, event.location.position)
+
+    def __delete(self, event: Event) -> bool:
+        return self.__delete_row(event.id)
+
+    def __add_row(self, uuid: UUID, basis: ndarray, xy: ndarray) -> bool:
+        if uuid not in self.__slot_of:
+            if self.__N == self.__phi_ijn.shape[0]:
+                self.__grow()
+            self.__slot_of[uuid] = self.__N
+            self.__id_at.append(uuid)
+            self.__phi_ijn[self.__N] = basis
+            self.__xy[self.__N] = xy
             self.__N += 1
             return True
         return False
 
-    def __move(self, event: Event) -> bool:
-        if event.id in self.__phi_ijn.columns:
-            location = self.__map.in_from(event.location)
-            phi_ijn = legvander2d(*location, self.__degree)[0]/self.__scale.vec
-            self.__phi_ijn.loc[:, event.id] = phi_ijn
+    def __move_row(self, uuid: UUID, basis: ndarray, xy: ndarray) -> bool:
+        if uuid in self.__slot_of:
+            slot = self.__slot_of[uuid]
+            self.__phi_ijn[slot] = basis
+            self.__xy[slot] = xy
             return True
         return False
 
-    def __delete(self, event: Event) -> bool:
-        if event.id in self.__phi_ijn.columns:
-            self.__phi_ijn.drop(event.id, axis=1, inplace=True)
+    def __delete_row(self, uuid: UUID) -> bool:
+        if uuid in self.__slot_of:
+            slot = self.__slot_of.pop(uuid)
+            last = self.__N - 1
+            moved = self.__id_at.pop()
+            if slot != last:
+                self.__phi_ijn[slot] = self.__phi_ijn[last]
+                self.__xy[slot] = self.__xy[last]
+                self.__id_at[slot] = moved
+                self.__slot_of[moved] = slot
             self.__N -= 1
             return True
         return False
 
+    def __basis_at(self, point: PointAt) -> ndarray:
+        location = self.__map.in_from(point)
+        return legvander2d(*location, self.__degree)[0] / self.__scale.vec
+
+    def __grow(self) -> None:
+        capacity, n_coeffs = self.__phi_ijn.shape
+        phi_ijn = empty((2 * capacity, n_coeffs))
+        phi_ijn[:capacity] = self.__phi_ijn
+        self.__phi_ijn = phi_ijn
+        xy = empty((2 * capacity, 2))
+        xy[:capacity] = self.__xy
+        self.__xy = xy
+
     def __lagrangian(self, c: ndarray) -> float64:
-        return self.__neg_log_l(c[1:]) + c[0]*self.__norm(c[1:])
+        return lagrangian(c, self.__phi)
 
     def __grad_lagrangian(self, c: ndarray) -> ndarray:
-        self.__grad_c[0] = self.__norm(c[1:])
-        self.__grad_c[1:] = self.__grad_neg_log_l(c[1:]) + 2.0*c[0]*c[1:]
-        return self.__grad_c
+        return grad_lagrangian(c, self.__phi, self.__grad_c)
 
     def __neg_log_l(self, c: ndarray) -> float64:
-        return -log(square(c.dot(self.__phi_ijn.values))).sum()
+        return neg_log_l(c, self.__phi)
 
     def __grad_neg_log_l(self, c: ndarray) -> ndarray:
-        return float64(-2.0) * (self.__phi_ijn.values /
-               c.dot(self.__phi_ijn.values)).sum(axis=1)
+        return grad_neg_log_l(c, self.__phi)
 
     @staticmethod
     def __norm(c: ndarray) -> float64:
-        return c.dot(c) - float64(1.0)
+        return norm(c)
 
     @staticmethod
     def __grad_norm(c: ndarray) -> ndarray:
@@ -122,7 +263,12 @@ class SerialEstimator:
 
     @property
     def _phi(self) -> DataFrame:
-        return self.__phi_ijn
+        return DataFrame(self.__phi.T, index=range(self.__c.vec.size),
+                         columns=self.__id_at)
+
+    @property
+    def __phi(self) -> ndarray:
+        return self.__phi_ijn[:self.__N]
 
     @property
     def _N(self) -> int:
@@ -157,3 +303,42 @@ class SerialEstimator:
         if type(value) is not Grid:
             raise TypeError('Grid must be of type <Grid>!')
         return value
+
+    @staticmethod
+    def __arrays_type_and_shape_checked(ids: list, actions: ndarray,
+                                        xy: ndarray) -> tuple:
+        if type(actions) is not ndarray or type(xy) is not ndarray:
+            raise TypeError('Actions and locations must be numpy arrays!')
+        if xy.ndim != 2 or xy.shape[1] != 2:
+            raise ValueError('Locations must be an array of shape (N, 2)!')
+        if not len(ids) == actions.size == xy.shape[0]:
+            raise ValueError('IDs, actions, and locations must match in size!')
+        return ids, actions, xy
+
+    @staticmethod
+    def __boolean_type_checked(value: bool) -> bool:
+        if type(value) is not bool:
+            raise TypeError('Flag for lazy refitting must be a boolean!')
+        return value
+
+
+def lagrangian(c: ndarray, phi_ijn: ndarray) -> float64:
+    return neg_log_l(c[1:], phi_ijn) + c[0]*norm(c[1:])
+
+
+def grad_lagrangian(c: ndarray, phi_ijn: ndarray, out: ndarray) -> ndarray:
+    out[0] = norm(c[1:])
+    out[1:] = grad_neg_log_l(c[1:], phi_ijn) + 2.0*c[0]*c[1:]
+    return out
+
+
+def neg_log_l(c: ndarray, phi_ijn: ndarray) -> float64:
+    return -log(square(phi_ijn.dot(c))).sum()
+
+
+def grad_neg_log_l(c: ndarray, phi_ijn: ndarray) -> ndarray:
+    return float64(-2.0) * phi_ijn.T.dot(1.0 / phi_ijn.dot(c))
+
+
+def norm(c: ndarray) -> float64:
+    return c.dot(c) - float64(1.0)
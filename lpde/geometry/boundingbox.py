@@ -47,7 +47,16 @@ class BoundingBox:
         y_inside = self.__y_range[0] <= point.position[1] <= self.__y_range[1]
         return True if x_inside and y_inside else False
 
+    def contain_many(self, xy: ndarray) -> ndarray:
+        xy = self.__array_type_and_shape_checked(xy)
+        x_inside = (self.__x_range[0] <= xy[:, 0]) & \
+                   (xy[:, 0] <= self.__x_range[1])
+        y_inside = (self.__y_range[0] <= xy[:, 1]) & \
+                   (xy[:, 1] <= self.__y_range[1])
+        return x_inside & y_inside
+
     contains = contain
+    contains_many = contain_many
     is_geo = are_geo
 
     @staticmethod
@@ -56,6 +65,14 @@ class BoundingBox:
             raise TypeError('Center must be of type <PointAt>!')
         return value
 
+    @staticmethod
+    def __array_type_and_shape_checked(value: ndarray) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Points must be given as a numpy array!')
+        if value.ndim != 2 or value.shape[1] != 2:
+            raise ValueError('Array of points must have shape (M, 2)!')
+        return value
+
     @staticmethod
     def __window_type_checked(value: Window) -> Window:
         if type(value) is not Window:
@@ -22,11 +22,27 @@ class Mapper:
     def bounds(self) -> BoundingBox:
         return self.__bounds
 
+    @property
+    def scale(self) -> ndarray:
+        return self.__in_scale
+
+    @property
+    def jacobian(self) -> float:
+        return 1.0 / self.__in_scale.prod()
+
     def in_from(self, point: PointAt) -> ndarray:
         point = self.__point_type_and_range_checked(point)
         relative_position = point.position - self.__bounds.center
         return relative_position * self.__in_scale
 
+    def in_from_many(self, xy: ndarray) -> ndarray:
+        xy = self.__array_type_and_shape_checked(xy)
+        return (xy - self.__bounds.center) * self.__in_scale
+
+    def back_from_many(self, mapped_xy: ndarray) -> ndarray:
+        mapped_xy = self.__array_type_and_shape_checked(mapped_xy)
+        return mapped_xy / self.__in_scale + self.__bounds.center
+
     def out(self, density: Union[float64, ndarray]) -> Union[float64, ndarray]:
         return density * self.__out_scale
 
@@ -42,6 +58,14 @@ class Mapper:
             raise TypeError('Support must be of type <WidthOf>!')
         return value
 
+    @staticmethod
+    def __array_type_and_shape_checked(value: ndarray) -> ndarray:
+        if type(value) is not ndarray:
+            raise TypeError('Points must be given as a numpy array!')
+        if value.ndim != 2 or value.shape[1] != 2:
+            raise ValueError('Array of points must have shape (M, 2)!')
+        return value
+
     def __point_type_and_range_checked(self, value: PointAt) -> PointAt:
         if type(value) is not PointAt:
             raise TypeError('Point must be of type <PointAt>!')
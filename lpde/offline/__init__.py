@@ -0,0 +1,3 @@
+from .events import EVENT_RECORD, read_events
+from .fitting import fit_events, write_series
+from .selection import select_degree
@@ -0,0 +1,72 @@
+from typing import Iterator
+from uuid import UUID
+from numpy import ndarray, uint8, empty, load, frombuffer
+from pandas import DataFrame, read_csv
+from ..estimators.datatypes import Action, EVENT_RECORD
+
+CHUNK_SIZE: int = 100000  # Events read from file at once.
+COLUMNS: tuple = EVENT_RECORD.names
+
+
+def read_events(path: str, chunk_size: int =CHUNK_SIZE) -> Iterator:
+    path = path_type_checked(path)
+    chunk_size = chunk_size_type_and_range_checked(chunk_size)
+    if path.endswith('.npy'):
+        return npy_chunks(path, chunk_size)
+    if path.endswith('.csv'):
+        return csv_chunks(path, chunk_size)
+    if path.endswith('.parquet'):
+        return parquet_chunks(path, chunk_size)
+    raise ValueError('Event logs must be .npy, .csv, or .parquet files!')
+
+
+def npy_chunks(path: str, chunk_size: int) -> Iterator:
+    events = load(path, mmap_mode='r')
+    if events.dtype != EVENT_RECORD:
+        raise TypeError('Events in .npy files must be of dtype EVENT_RECORD!')
+    for start in range(0, events.size, chunk_size):
+        yield events[start:start + chunk_size].view(ndarray)
+
+
+def csv_chunks(path: str, chunk_size: int) -> Iterator:
+    for frame in read_csv(path, usecols=COLUMNS, chunksize=chunk_size):
+        yield records_from(frame)
+
+
+def parquet_chunks(path: str, chunk_size: int) -> Iterator:
+    try:
+        from pyarrow.parquet import ParquetFile
+    except ImportError:
+        raise ImportError('Reading .parquet files requires pyarrow!')
+    batches = ParquetFile(path).iter_batches(chunk_size, columns=COLUMNS)
+    for batch in batches:
+        yield records_from(batch.to_pandas())
+
+
+def records_from(frame: DataFrame) -> ndarray:
+    records = empty(len(frame), EVENT_RECORD)
+    records['time'] = frame['time']
+    uuids = b''.join(UUID(str(uuid)).bytes for uuid in frame['id'])
+    records['id'] = frombuffer(uuids, uint8).reshape(-1, 16)
+    actions = frame['action']
+    if actions.dtype.kind in 'iu':
+        records['action'] = actions
+    else:
+        records['action'] = [Action[name].value for name in actions]
+    records['x'] = frame['x']
+    records['y'] = frame['y']
+    return records
+
+
+def path_type_checked(value: str) -> str:
+    if type(value) is not str:
+        raise TypeError('Path to the event log must be a string!')
+    return value
+
+
+def chunk_size_type_and_range_checked(value: int) -> int:
+    if type(value) is not int:
+        raise TypeError('Chunk size must be an integer!')
+    if value < 1:
+        raise ValueError('Chunk size must be at least 1!')
+    return value
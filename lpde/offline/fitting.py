@@ -0,0 +1,80 @@
+from typing import Iterator
+from uuid import UUID
+from numpy import ndarray, dtype, float64, int64, floor, nonzero, split
+from numpy import column_stack, empty, zeros, arange, save, concatenate
+from ..estimators import SerialEstimator
+from ..estimators.datatypes import Degree, Solution
+from ..geometry import Mapper
+from .events import read_events, CHUNK_SIZE
+
+
+def fit_events(degree: Degree, mapper: Mapper, path: str, every: int =None,
+               seconds: float =None,
+               chunk_size: int =CHUNK_SIZE) -> Iterator[Solution]:
+    every = count_type_and_range_checked(every)
+    seconds = interval_type_and_range_checked(seconds)
+    estimator = SerialEstimator(degree, mapper, lazy=True)
+    applied = 0
+    bucket = None
+    latest = None
+    for chunk in read_events(path, chunk_size):
+        due = zeros(chunk.size, bool)
+        if every is not None:
+            due |= (applied + arange(chunk.size)) % every == 0
+            due[0] &= applied > 0
+        if seconds is not None:
+            buckets = floor(chunk['time'] / seconds)
+            first = buckets[0] if bucket is None else bucket
+            previous = concatenate(([first], buckets[:-1]))
+            due |= buckets != previous
+            bucket = buckets[-1]
+        cuts = nonzero(due)[0]
+        for n, segment in enumerate(split(chunk, cuts)):
+            if n > 0:
+                yield solution_of(estimator, latest)
+            if segment.size:
+                apply(estimator, segment)
+                latest = segment['time'][-1]
+        applied += chunk.size
+    if latest is not None:
+        yield solution_of(estimator, latest)
+
+
+def write_series(path: str, solutions: Iterator[Solution]) -> ndarray:
+    solutions = list(solutions)
+    n_coeffs = solutions[0].coeffs.size if solutions else 0
+    series = empty(len(solutions), dtype([('time', float64),
+                                          ('N', int64),
+                                          ('coeffs', float64, n_coeffs)]))
+    for row, solution in zip(series, solutions):
+        row['time'], row['N'], row['coeffs'] = solution
+    save(path, series)
+    return series
+
+
+def apply(estimator: SerialEstimator, segment: ndarray) -> None:
+    ids = [UUID(bytes=uuid.tobytes()) for uuid in segment['id']]
+    xy = column_stack((segment['x'], segment['y']))
+    estimator.update_with_arrays(ids, segment['action'], xy)
+
+
+def solution_of(estimator: SerialEstimator, latest: float64) -> Solution:
+    if estimator.dirty:
+        estimator.refit()
+    return Solution(latest, estimator._N, estimator._c.copy())
+
+
+def count_type_and_range_checked(value: int) -> int:
+    if value is not None and type(value) is not int:
+        raise TypeError('Number of events between solutions must be an int!')
+    if value is not None and value < 1:
+        raise ValueError('Number of events between solutions must be > 0!')
+    return value
+
+
+def interval_type_and_range_checked(value: float) -> float:
+    if value is not None and type(value) not in (int, float, float64):
+        raise TypeError('Time between solutions must be a number!')
+    if value is not None and value <= 0:
+        raise ValueError('Time between solutions must be positive!')
+    return value
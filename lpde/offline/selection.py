@@ -0,0 +1,133 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from time import perf_counter
+from numpy import ndarray, float64, square, log, zeros, maximum, nan
+from numpy.random import default_rng
+from numpy.polynomial.legendre import legvander
+from scipy.optimize import fmin_l_bfgs_b
+from pandas import DataFrame
+from ..estimators.datatypes import Degree, Scalings, LagrangeCoefficients
+from ..estimators.serial.serial import lagrangian, grad_lagrangian
+from ..estimators.serial.serial import GRADIENT_TOLERANCE
+from ..geometry import BoundingBox, Mapper, WidthOf
+
+FOLDS: int = 5
+TOLERANCE: float = 0.01  # Held-out log-likelihood per point given up.
+MAXIMUM_ITERATIONS: int = 10000
+DENSITY_FLOOR: float = 1e-300  # Keeps the log finite at nodes of a fit.
+
+
+def select_degree(xy: ndarray, bounds: BoundingBox, degrees: list,
+                  widths: list, folds: int =FOLDS,
+                  tolerance: float =TOLERANCE, n_jobs: int =None,
+                  seed: int =None) -> DataFrame:
+    xy = array_type_and_shape_checked(xy)
+    bounds = boundingbox_type_checked(bounds)
+    degrees = degrees_type_checked(degrees)
+    widths = widths_type_checked(widths)
+    folds = folds_type_and_range_checked(folds, xy.shape[0])
+    inside = bounds.contain_many(xy)
+    xy = xy[inside]
+    fold_of = default_rng(seed).permutation(xy.shape[0]) % folds
+    k_max = max(degree.k_max for degree in degrees)
+    l_max = max(degree.l_max for degree in degrees)
+    tables = {}
+    for width in widths:
+        mapper = Mapper(bounds, width)
+        mapped = mapper.in_from_many(xy)
+        tables[width] = (legvander(mapped[:, 0], k_max),
+                         legvander(mapped[:, 1], l_max),
+                         mapper.scale.prod())
+    trials = list(product(degrees, widths))
+    with ProcessPoolExecutor(n_jobs) as pool:
+        futures = [pool.submit(cross_validated, *tables[width][:2],
+                               degree, fold_of, tables[width][2])
+                   for degree, width in trials]
+        results = [future.result() for future in futures]
+    scores = DataFrame(results, columns=('loglik', 'std', 'seconds',
+                                         'converged'))
+    scores.insert(0, 'degree', [degree for degree, _ in trials])
+    scores.insert(1, 'width', [width.legendre_support for _, width in trials])
+    scores.insert(2, 'n_coeffs', [(degree.k_max + 1) * (degree.l_max + 1)
+                                  for degree, _ in trials])
+    candidates = scores[scores.converged]
+    scores['recommended'] = False
+    if not candidates.empty:
+        best = candidates.loglik.max()
+        acceptable = candidates[candidates.loglik >= best - tolerance]
+        cheapest = acceptable.sort_values(['n_coeffs', 'seconds'])
+        scores.loc[cheapest.index[0], 'recommended'] = True
+    return scores.sort_values('loglik', ascending=False)
+
+
+def cross_validated(basis_x: ndarray, basis_y: ndarray, degree: Degree,
+                    fold_of: ndarray, in_scale: float) -> tuple:
+    scale = Scalings(degree)
+    phi = (basis_x[:, :degree.k_max + 1, None] *
+           basis_y[:, None, :degree.l_max + 1]).reshape(basis_x.shape[0], -1)
+    phi /= scale.vec
+    logliks = []
+    seconds = 0.0
+    n_folds = fold_of.max() + 1
+    for fold in range(n_folds):
+        held_out = fold_of == fold
+        start = perf_counter()
+        coeffs = fitted(phi[~held_out], degree)
+        seconds += perf_counter() - start
+        if coeffs is None:
+            continue
+        density = square(phi[held_out].dot(coeffs)) * in_scale
+        logliks.append(log(maximum(density, DENSITY_FLOOR)).mean())
+    if not logliks:
+        return nan, nan, seconds / n_folds, False
+    logliks = float64(logliks)
+    converged = len(logliks) == n_folds
+    return logliks.mean(), logliks.std(), seconds / n_folds, converged
+
+
+def fitted(phi: ndarray, degree: Degree) -> ndarray:
+    c_init = LagrangeCoefficients(degree)
+    c_init.lagrange = phi.shape[0]
+    gradient = zeros(c_init.vector.size)
+    coefficients, _, status = fmin_l_bfgs_b(
+        lambda c: lagrangian(c, phi), c_init.vector,
+        lambda c: grad_lagrangian(c, phi, gradient),
+        maxiter=MAXIMUM_ITERATIONS)
+    converged = gradient.dot(gradient) < GRADIENT_TOLERANCE
+    if status['warnflag'] == 0 and converged:
+        return coefficients[1:]
+    return None
+
+
+def array_type_and_shape_checked(value: ndarray) -> ndarray:
+    if type(value) is not ndarray:
+        raise TypeError('Points must be given as a numpy array!')
+    if value.ndim != 2 or value.shape[1] != 2:
+        raise ValueError('Points must be an array of shape (N, 2)!')
+    return value
+
+
+def boundingbox_type_checked(value: BoundingBox) -> BoundingBox:
+    if type(value) is not BoundingBox:
+        raise TypeError('Bounds must be of type <BoundingBox>!')
+    return value
+
+
+def degrees_type_checked(value: list) -> list:
+    if not value or not all(type(degree) is Degree for degree in value):
+        raise TypeError('Degrees must be a non-empty list of <Degree>!')
+    return list(value)
+
+
+def widths_type_checked(value: list) -> list:
+    if not value or not all(type(width) is WidthOf for width in value):
+        raise TypeError('Widths must be a non-empty list of <WidthOf>!')
+    return list(value)
+
+
+def folds_type_and_range_checked(value: int, n_points: int) -> int:
+    if type(value) is not int:
+        raise TypeError('Number of folds must be an integer!')
+    if not 2 <= value <= n_points:
+        raise ValueError('Number of folds must be between 2 and N!')
+    return value
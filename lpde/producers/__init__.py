@@ -1,3 +1,3 @@
 from .mockup import MockParams, MockProducer
-
-PRODUCER_TYPES = (MockParams,)
+from .replay import ReplayParams, ReplayProducer
+from .registry import PRODUCERS, register
@@ -1,6 +1,12 @@
-from numpy.random import multivariate_normal as mv_norm
+from numpy import clip, ndarray, empty, array, float64
+from numpy.random import Generator, default_rng, normal
+from scipy.special import ndtr
 from ..geometry import PointAt, BoundingBox
 
+DEFAULT_BATCH_SIZE: int = 1024
+OVERSAMPLING: float = 1.2  # Spare draws per expected acceptance.
+MIN_ACCEPTANCE: float = 0.01  # Caps the batch size for far-off centers.
+
 
 def boundingbox_type_checked(value) -> BoundingBox:
     if type(value) is not BoundingBox:
@@ -9,9 +15,79 @@ def boundingbox_type_checked(value) -> BoundingBox:
 
 
 def gaussian(bounds: BoundingBox) -> PointAt:
+    x, y = gaussian_batch(bounds, 1)[0]
+    return PointAt(x, y)
+
+
+def gaussian_batch(bounds: BoundingBox, n: int,
+                   rng: Generator =None) -> ndarray:
     bounds = boundingbox_type_checked(bounds)
-    sigma_x = (bounds.window[0]/10.0)**2
-    sigma_y = (bounds.window[1]/10.0)**2
-    x, y = mv_norm(bounds.center, ((sigma_x, 0), (0, sigma_y)))
-    candidate = PointAt(x, y)
-    return candidate if bounds.contain(candidate) else gaussian(bounds)
+    draw = normal if rng is None else rng.normal
+    lower = array([bounds.x_range[0], bounds.y_range[0]])
+    upper = array([bounds.x_range[1], bounds.y_range[1]])
+    return truncated_normal(bounds.center, bounds.window / 10.0,
+                            lower, upper, n, draw)
+
+
+def truncated_normal(center: ndarray, sigma: ndarray, lower: ndarray,
+                     upper: ndarray, n: int, draw=normal) -> ndarray:
+    accepted = empty((n, 2))
+    filled = 0
+    acceptance = max(mass_between(center, sigma, lower, upper),
+                     MIN_ACCEPTANCE)
+    while filled < n:
+        size = int((n - filled) / acceptance * OVERSAMPLING) + 1
+        candidates = draw(center, sigma, (size, 2))
+        inside = ((lower <= candidates) & (candidates <= upper)).all(axis=1)
+        taken = candidates[inside][:n - filled]
+        accepted[filled:filled + taken.shape[0]] = taken
+        filled += taken.shape[0]
+    return accepted
+
+
+def mass_between(center: ndarray, sigma: ndarray, lower: ndarray,
+                 upper: ndarray) -> float64:
+    mass = ndtr((upper - center) / sigma) - ndtr((lower - center) / sigma)
+    return clip(mass.prod(), 1e-12, 1.0)
+
+
+class Estimated:
+    def __init__(self, estimator, batch: int =DEFAULT_BATCH_SIZE,
+                 seed: int =None) -> None:
+        self.__estimator = self.__estimator_type_checked(estimator)
+        self.__batch = self.__integer_type_and_range_checked(batch)
+        self.__rng = default_rng(seed)
+        self.__relative = []
+
+    def __call__(self, bounds: BoundingBox) -> PointAt:
+        bounds = boundingbox_type_checked(bounds)
+        if not self.__relative:
+            self.__relative = list(self.__relative_samples())
+        x, y = bounds.center + self.__relative.pop() * bounds.window
+        return PointAt(x, y)
+
+    def draw(self, bounds: BoundingBox, n: int,
+             rng: Generator =None) -> ndarray:
+        bounds = boundingbox_type_checked(bounds)
+        relative = self.__relative_samples(n, rng or self.__rng)
+        return bounds.center + relative * bounds.window
+
+    def __relative_samples(self, n: int =None, rng: Generator =None):
+        xy = self.__estimator.sample(n or self.__batch, rng or self.__rng)
+        estimator_bounds = self.__estimator.bounds
+        relative = (xy - estimator_bounds.center) / estimator_bounds.window
+        return clip(relative, -0.5, 0.5)
+
+    @staticmethod
+    def __estimator_type_checked(value):
+        if not callable(getattr(value, 'sample', None)):
+            raise TypeError('Estimator must be able to sample points!')
+        return value
+
+    @staticmethod
+    def __integer_type_and_range_checked(value: int) -> int:
+        if type(value) is not int:
+            raise TypeError('Batch size must be an integer!')
+        if value < 1:
+            raise ValueError('Batch size must be at least 1!')
+        return value
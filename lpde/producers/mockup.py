@@ -1,22 +1,27 @@
 from time import sleep, perf_counter
 from typing import Callable
-from random import randint, expovariate, sample
-from uuid import uuid4
+from uuid import UUID
 from multiprocessing import Process
 from multiprocessing.connection import Connection
-from numpy import float64
+from numpy import float64, inf, zeros
+from numpy.random import default_rng, seed as seed_global_rng
 from ..geometry import PointAt, Window, BoundingBox
-from ..estimators.datatypes import Action, Event, Flags
+from ..estimators.datatypes import Action, Event, Flags, Timings
+from ..estimators.profiling import profiled
 
 TIMEOUT: float = 1.0
 DIST_TYPE = Callable[[BoundingBox], PointAt]
+STAGES = ('produce', 'sleep', 'push')
 
 
 class MockParams:
-    def __init__(self, rate: float, build_up: int, dist: callable) -> None:
+    def __init__(self, rate: float, build_up: int, dist: callable,
+                 seed: int =None, batch: int =1) -> None:
         self.__rate = self.__float_type_and_range_checked(rate)
         self.__build_up = self.__integer_type_and_range_checked(build_up)
         self.__dist = self.__function_type_checked(dist)
+        self.__seed = self.__seed_type_checked(seed)
+        self.__batch = self.__integer_type_and_range_checked(batch)
 
     @property
     def rate(self) -> float:
@@ -30,6 +35,20 @@ class MockParams:
     def dist(self) -> DIST_TYPE:
         return self.__dist
 
+    @property
+    def seed(self) -> int:
+        return self.__seed
+
+    @property
+    def batch(self) -> int:
+        return self.__batch
+
+    @staticmethod
+    def __seed_type_checked(value: int) -> int:
+        if value is not None and type(value) is not int:
+            raise TypeError('Seed must be an integer!')
+        return value
+
     @staticmethod
     def __float_type_and_range_checked(value: float) -> float:
         if type(value) not in (int, float, float64):
@@ -72,57 +91,84 @@ class MockProducer(Process):
         self.__bounds = self.__bounds_type_checked(bounds)
         self.__event_pipe = self.__connection_type_checked(event_pipe)
         self.__flag = Flags()
-        self.__points = {}
+        self.__timings = Timings(STAGES)
+        self.__points = []
         self.__according_to = {1: self.__add,
-                               0: self.__move,
-                              -1: self.__delete}
+                                0: self.__move,
+                               -1: self.__delete}
 
     @property
     def flag(self) -> Flags:
         return self.__flag
 
+    @property
+    def timings(self) -> Timings:
+        return self.__timings
+
+    @profiled
     def run(self) -> None:
+        if self.__params.seed is not None:
+            seed_global_rng(self.__params.seed)
+        self.__rng = default_rng(self.__params.seed)
         n_points = 0
-        # start = perf_counter()
+        due = tick = perf_counter()
         while not self.__flag.stop.is_set():
-            if n_points < self.__params.build_up:
-                event = self.__add()
-                n_points += 1
-            else:
-                event_type = randint(-1, 1) if self.__points else 1
-                event = self.__according_to[event_type]()
-                n_points += 1
-            self.__push(event)
-            # if n_points == 10000:
-            #     stop = perf_counter()
-            #     print('Average time per event:', (stop - start)/10000)
+            actions, intervals = self.__schedule(n_points)
+            locations = self.__new_locations(actions.size)
+            events = [self.__event_for(action, location)
+                      for action, location in zip(actions, locations)]
+            n_points += len(events)
+            due += intervals.sum()
+            tick = self.__timings.since('produce', tick)
+            sleep(max(due - tick, 0.0))
+            tick = self.__timings.since('sleep', tick)
+            self.__push(events if self.__params.batch > 1 else events[0])
+            tick = self.__timings.since('push', tick)
         self.__event_pipe.close()
         self.__flag.done.set()
 
-    def __add(self) -> Event:
-        location = self.__new_location()
-        uuid = uuid4()
-        self.__points[uuid] = location
+    def __schedule(self, n_points: int) -> tuple:
+        batch = self.__params.batch
+        actions = self.__rng.integers(-1, 1, batch, endpoint=True)
+        actions[:max(self.__params.build_up - n_points, 0)] = 1
+        if self.__params.rate == inf:
+            return actions, zeros(batch)
+        return actions, self.__rng.exponential(1.0/self.__params.rate, batch)
+
+    def __event_for(self, action: int, location: PointAt) -> Event:
+        return self.__according_to[action if self.__points else 1](location)
+
+    def __add(self, location: PointAt) -> Event:
+        uuid = UUID(bytes=self.__rng.bytes(16), version=4)
+        self.__points.append(uuid)
         return Event(uuid, Action.ADD, location)
 
-    def __move(self) -> Event:
-        location = self.__new_location()
-        uuid = sample(self.__points.keys(), 1)[0]
-        self.__points[uuid] = location
+    def __move(self, location: PointAt) -> Event:
+        uuid = self.__points[self.__rng.integers(len(self.__points))]
         return Event(uuid, Action.MOVE, location)
 
-    def __delete(self) -> Event:
-        uuid = sample(self.__points.keys(), 1)[0]
-        _ = self.__points.pop(uuid)
+    def __delete(self, _: PointAt) -> Event:
+        slot = self.__rng.integers(len(self.__points))
+        uuid = self.__points[slot]
+        last = self.__points.pop()
+        if slot < len(self.__points):
+            self.__points[slot] = last
         return Event(uuid, Action.DELETE)
 
-    def __push(self, event: Event) -> None:
-        sleep(expovariate(self.__params.rate))
+    def __push(self, events) -> None:
         try:
-            self.__event_pipe.send(event)
+            self.__event_pipe.send(events)
         except BrokenPipeError:
             raise BrokenPipeError('Event pipe appears to be closed!')
 
+    def __new_locations(self, n: int) -> list:
+        if hasattr(self.__params.dist, 'draw'):
+            xy = self.__params.dist.draw(self.__bounds, n, self.__rng)
+            if not self.__bounds.contain_many(xy).all():
+                raise ValueError('Distribution returned point out of bounds!')
+            return [PointAt(x, y) for x, y in xy]
+        return [self.__new_location() for _ in range(n)]
+
     def __new_location(self) -> PointAt:
         location: PointAt = self.__params.dist(self.__bounds)
         if not self.__bounds.contain(location):
@@ -0,0 +1,15 @@
+from multiprocessing import Process
+from .mockup import MockParams, MockProducer
+from .replay import ReplayParams, ReplayProducer
+
+PRODUCERS = {MockParams: MockProducer,
+             ReplayParams: ReplayProducer}
+
+
+def register(params_type: type, producer_type: type) -> None:
+    if type(params_type) is not type:
+        raise TypeError('Producer parameters must be given as a class!')
+    if type(producer_type) is not type or \
+            not issubclass(producer_type, Process):
+        raise TypeError('Producers must be subclasses of <Process>!')
+    PRODUCERS[params_type] = producer_type
@@ -0,0 +1,129 @@
+from time import perf_counter
+from uuid import UUID
+from multiprocessing import Process
+from multiprocessing.connection import Connection
+from numpy import ndarray, float64, load, memmap
+from ..geometry import PointAt, BoundingBox
+from ..estimators.datatypes import Action, Event, Flags, Timings
+from ..estimators.datatypes import EVENT_RECORD
+from ..estimators.profiling import profiled
+
+BATCH_SIZE: int = 1024  # Records read from the memory-mapped log at once.
+STAGES = ('read', 'wait', 'push')
+
+
+class ReplayParams:
+    def __init__(self, path: str, speed: float =1.0) -> None:
+        self.__path = self.__path_type_checked(path)
+        self.__speed = self.__float_type_and_range_checked(speed)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def speed(self) -> float:
+        return self.__speed
+
+    @staticmethod
+    def __path_type_checked(value: str) -> str:
+        if type(value) is not str:
+            raise TypeError('Path to the event log must be a string!')
+        try:
+            events = events_in(value)
+        except (OSError, ValueError):
+            raise OSError(f'Could not memory-map event log "{value}"!')
+        if events.dtype != EVENT_RECORD:
+            raise TypeError('Event log must consist of EVENT_RECORDs!')
+        return value
+
+    @staticmethod
+    def __float_type_and_range_checked(value: float) -> float:
+        if type(value) not in (int, float, float64):
+            raise TypeError('Replay speed must be a number!')
+        if value <= 0.0:
+            raise ValueError('Replay speed must be positive (or inf)!')
+        return value
+
+
+class ReplayProducer(Process):
+    def __init__(self, params: ReplayParams, bounds: BoundingBox,
+                 event_pipe: Connection) -> None:
+        super().__init__()
+        self.__params = self.__params_type_checked(params)
+        self.__bounds = self.__bounds_type_checked(bounds)
+        self.__event_pipe = self.__connection_type_checked(event_pipe)
+        self.__flag = Flags()
+        self.__timings = Timings(STAGES)
+
+    @property
+    def flag(self) -> Flags:
+        return self.__flag
+
+    @property
+    def timings(self) -> Timings:
+        return self.__timings
+
+    @profiled
+    def run(self) -> None:
+        events = events_in(self.__params.path)
+        first = events['time'][0] if events.size else 0.0
+        start = tick = perf_counter()
+        for offset in range(0, events.size, BATCH_SIZE):
+            batch = events[offset:offset + BATCH_SIZE]
+            dues = start + (batch['time'] - first) / self.__params.speed
+            for record, due in zip(batch, dues):
+                event = self.__event_from(record)
+                tick = self.__timings.since('read', tick)
+                if self.__flag.stop.wait(max(due - tick, 0.0)):
+                    break
+                tick = self.__timings.since('wait', tick)
+                self.__push(event)
+                tick = self.__timings.since('push', tick)
+            if self.__flag.stop.is_set():
+                break
+        self.__flag.stop.wait()
+        self.__event_pipe.close()
+        self.__flag.done.set()
+
+    @staticmethod
+    def __event_from(record: ndarray) -> Event:
+        uuid = UUID(bytes=record['id'].tobytes())
+        action = Action(int(record['action']))
+        if action is Action.DELETE:
+            return Event(uuid, action)
+        return Event(uuid, action, PointAt(record['x'], record['y']))
+
+    def __push(self, event: Event) -> None:
+        try:
+            self.__event_pipe.send(event)
+        except BrokenPipeError:
+            raise BrokenPipeError('Event pipe appears to be closed!')
+
+    @staticmethod
+    def __params_type_checked(value: ReplayParams) -> ReplayParams:
+        if type(value) is not ReplayParams:
+            raise TypeError('Parameters must be of type <ReplayParams>!')
+        return value
+
+    @staticmethod
+    def __bounds_type_checked(value: BoundingBox) -> BoundingBox:
+        if type(value) is not BoundingBox:
+            raise TypeError('Bounds must be of type <BoundingBox>!')
+        return value
+
+    @staticmethod
+    def __connection_type_checked(value: Connection) -> Connection:
+        if type(value) is not Connection:
+            raise TypeError('Event pipe must be a multiprocessing Connection!')
+        if value.closed:
+            raise ValueError('Event pipe must not be closed on instantiation!')
+        if value.readable or not value.writable:
+            raise ValueError('Event pipe should be write-only!')
+        return value
+
+
+def events_in(path: str) -> ndarray:
+    if path.endswith('.npy'):
+        return load(path, mmap_mode='r')
+    return memmap(path, EVENT_RECORD, 'r')
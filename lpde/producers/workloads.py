@@ -0,0 +1,196 @@
+from abc import ABC, abstractmethod
+from time import time
+from numpy import ndarray, float64, array, empty, zeros, ones, exp, cos, pi
+from numpy import asarray
+from numpy.random import Generator, default_rng
+from ..geometry import PointAt, BoundingBox
+from .distributions import boundingbox_type_checked, truncated_normal
+from .distributions import mass_between
+
+HALF: float = 0.5  # Workloads live on the relative box [-0.5, 0.5]^2.
+
+
+class Workload(ABC):
+    def __init__(self, seed: int =None) -> None:
+        self.__rng = default_rng(seed)
+        self.__origin = time()
+
+    def __call__(self, bounds: BoundingBox) -> PointAt:
+        x, y = self.draw(bounds, 1, self.__rng)[0]
+        return PointAt(x, y)
+
+    def draw(self, bounds: BoundingBox, n: int, rng: Generator =None,
+             moment: float =None) -> ndarray:
+        bounds = boundingbox_type_checked(bounds)
+        n = count_type_and_range_checked(n)
+        rng = self.__rng if rng is None else rng
+        moment = self.__moment_or_now(moment)
+        relative = self._relative(n, rng, moment)
+        return bounds.center + relative * bounds.window
+
+    def pdf(self, xy: ndarray, bounds: BoundingBox,
+            moment: float =None) -> ndarray:
+        bounds = boundingbox_type_checked(bounds)
+        moment = self.__moment_or_now(moment)
+        relative = (xy - bounds.center) / bounds.window
+        inside = (abs(relative) <= HALF).all(axis=1)
+        density = self._density(relative, moment) / bounds.window.prod()
+        return density * inside
+
+    @abstractmethod
+    def _relative(self, n: int, rng: Generator, moment: float) -> ndarray:
+        ...
+
+    @abstractmethod
+    def _density(self, relative: ndarray, moment: float) -> ndarray:
+        ...
+
+    def __moment_or_now(self, moment: float) -> float:
+        return time() - self.__origin if moment is None else moment
+
+
+class Uniform(Workload):
+    def _relative(self, n: int, rng: Generator, moment: float) -> ndarray:
+        return rng.uniform(-HALF, HALF, (n, 2))
+
+    def _density(self, relative: ndarray, moment: float) -> ndarray:
+        return ones(relative.shape[0])
+
+
+class Gaussian(Workload):
+    def __init__(self, center: tuple =(0.0, 0.0), sigma: tuple =(0.1, 0.1),
+                 seed: int =None) -> None:
+        super().__init__(seed)
+        self.__center = pair_checked(center, 'Center')
+        self.__sigma = positive_pair_checked(sigma, 'Widths')
+
+    def _relative(self, n: int, rng: Generator, moment: float) -> ndarray:
+        return truncated_normal(self._center_at(moment), self.__sigma,
+                                -HALF, HALF, n, rng.normal)
+
+    def _density(self, relative: ndarray, moment: float) -> ndarray:
+        return truncated_normal_pdf(relative, self._center_at(moment),
+                                    self.__sigma)
+
+    def _center_at(self, moment: float) -> ndarray:
+        return self.__center
+
+
+class MovingCluster(Gaussian):
+    def __init__(self, start: tuple =(0.0, 0.0), velocity: tuple =(0.01, 0.0),
+                 sigma: tuple =(0.05, 0.05), seed: int =None) -> None:
+        super().__init__(start, sigma, seed)
+        self.__start = pair_checked(start, 'Start')
+        self.__velocity = pair_checked(velocity, 'Velocity')
+
+    def _center_at(self, moment: float) -> ndarray:
+        travelled = self.__start + self.__velocity * moment + HALF
+        return (1.0 - abs((travelled % 2.0) - 1.0)) - HALF
+
+
+class Mixture(Workload):
+    def __init__(self, components: list, weights: list =None,
+                 seed: int =None) -> None:
+        super().__init__(seed)
+        self.__components = components_type_checked(components)
+        weights = ones(len(components)) if weights is None else weights
+        self.__weights = weights_checked(weights, len(components))
+
+    def _weights_at(self, moment: float) -> ndarray:
+        return self.__weights
+
+    def _relative(self, n: int, rng: Generator, moment: float) -> ndarray:
+        counts = rng.multinomial(n, self._weights_at(moment))
+        relative = empty((n, 2))
+        which = rng.permutation(n)
+        start = 0
+        for component, count in zip(self.__components, counts):
+            rows = which[start:start + count]
+            relative[rows] = component._relative(count, rng, moment)
+            start += count
+        return relative
+
+    def _density(self, relative: ndarray, moment: float) -> ndarray:
+        density = zeros(relative.shape[0])
+        for component, weight in zip(self.__components,
+                                     self._weights_at(moment)):
+            density += weight * component._density(relative, moment)
+        return density
+
+
+class Hotspots(Mixture):
+    def __init__(self, centers: list, sigma: tuple =(0.05, 0.05),
+                 period: float =60.0, background: float =0.1,
+                 seed: int =None) -> None:
+        components = [Gaussian(center, sigma) for center in centers]
+        super().__init__(components + [Uniform()], None, seed)
+        self.__n_spots = len(centers)
+        self.__period = positive_checked(period, 'Period')
+        self.__background = fraction_checked(background, 'Background')
+
+    def _weights_at(self, moment: float) -> ndarray:
+        phases = 2.0*pi * (moment/self.__period +
+                           array(range(self.__n_spots))/self.__n_spots)
+        spots = (1.0 + cos(phases)) / 2.0
+        spots *= (1.0 - self.__background) / self.__n_spots
+        return array([*spots, 1.0 - spots.sum()])
+
+
+def truncated_normal_pdf(relative: ndarray, center: ndarray,
+                         sigma: ndarray) -> ndarray:
+    z = (relative - center) / sigma
+    density = exp(-0.5 * (z*z).sum(axis=1)) / (2.0*pi * sigma.prod())
+    return density / mass_between(center, sigma, -HALF, HALF)
+
+
+def count_type_and_range_checked(value: int) -> int:
+    if type(value) is not int:
+        raise TypeError('Number of points to draw must be an integer!')
+    if value < 1:
+        raise ValueError('Number of points to draw must be at least 1!')
+    return value
+
+
+def pair_checked(value: tuple, name: str) -> ndarray:
+    pair = asarray(value, dtype=float64)
+    if pair.shape != (2,):
+        raise ValueError(f'{name} must be a pair of numbers!')
+    return pair
+
+
+def positive_pair_checked(value: tuple, name: str) -> ndarray:
+    pair = pair_checked(value, name)
+    if (pair <= 0.0).any():
+        raise ValueError(f'{name} must be positive!')
+    return pair
+
+
+def positive_checked(value: float, name: str) -> float:
+    if type(value) not in (int, float, float64):
+        raise TypeError(f'{name} must be a number!')
+    if value <= 0.0:
+        raise ValueError(f'{name} must be positive!')
+    return float(value)
+
+
+def fraction_checked(value: float, name: str) -> float:
+    if type(value) not in (int, float, float64):
+        raise TypeError(f'{name} must be a number!')
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f'{name} must lie between 0 and 1!')
+    return float(value)
+
+
+def components_type_checked(value: list) -> list:
+    if not value or not all(isinstance(item, Workload) for item in value):
+        raise TypeError('Components must be a non-empty list of workloads!')
+    return list(value)
+
+
+def weights_checked(value: list, n_components: int) -> ndarray:
+    weights = asarray(value, dtype=float64)
+    if weights.shape != (n_components,) or (weights < 0.0).any():
+        raise ValueError('Need one non-negative weight per component!')
+    if not weights.sum() > 0.0:
+        raise ValueError('Weights must not all be zero!')
+    return weights / weights.sum()
@@ -0,0 +1,47 @@
+from uuid import uuid4
+from numpy import allclose, ones, int8
+from numpy.random import default_rng
+from lpde.geometry import WidthOf, Window, PointAt, BoundingBox, Mapper
+from lpde.estimators import SerialEstimator
+from lpde.estimators.datatypes import Degree, Coefficients
+
+BOUNDS = BoundingBox(PointAt(51.375, 35.675), Window(0.55, 0.35))
+ELSEWHERE = BoundingBox(PointAt(60.0, 60.0), Window(1.0, 1.0))
+DEGREE = Degree(6, 6)
+
+
+def fitted(lazy: bool =False) -> SerialEstimator:
+    estimator = SerialEstimator(DEGREE, Mapper(BOUNDS, WidthOf(1.8)), lazy)
+    xy = BOUNDS.center + default_rng(3).normal(0.0, 0.05, (200, 2))
+    xy = xy[BOUNDS.contain_many(xy)]
+    ids = [uuid4() for _ in range(xy.shape[0])]
+    estimator.update_with_arrays(ids, ones(len(ids), int8), xy)
+    _ = estimator.at(PointAt(*BOUNDS.center))
+    return estimator
+
+
+def assert_reset(estimator: SerialEstimator) -> None:
+    assert estimator._N == 0
+    assert not estimator.dirty
+    assert allclose(estimator._c, Coefficients(DEGREE).vec)
+
+
+def test_loading_mismatched_empty_checkpoint_resets_fit(tmp_path):
+    path = str(tmp_path / 'empty.npz')
+    SerialEstimator(Degree(3, 3), Mapper(BOUNDS, WidthOf(1.8))).save(path)
+    for lazy in (False, True):
+        estimator = fitted(lazy)
+        estimator.load(path)
+        assert_reset(estimator)
+
+
+def test_loading_checkpoint_without_points_inside_resets_fit(tmp_path):
+    path = str(tmp_path / 'elsewhere.npz')
+    other = SerialEstimator(DEGREE, Mapper(ELSEWHERE, WidthOf(1.8)))
+    other.update_with_arrays([uuid4()], ones(1, int8),
+                             ELSEWHERE.center[None])
+    other.save(path)
+    for lazy in (False, True):
+        estimator = fitted(lazy)
+        estimator.load(path)
+        assert_reset(estimator)
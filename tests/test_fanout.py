@@ -0,0 +1,60 @@
+from multiprocessing import Pipe, Queue
+from queue import Empty
+from time import sleep
+from uuid import uuid4
+from lpde.geometry import WidthOf, Window, PointAt, BoundingBox, Mapper
+from lpde.estimators.datatypes import Degree, Event, Action, Overload
+from lpde.estimators.parallel.controller import FOLLOWER_OVERLOAD
+from lpde.estimators.parallel.datagate import DataGateParams, DataGate
+from lpde.estimators.parallel.publication import Publication
+
+CENTER = PointAt(51.375, 35.675)
+BOUNDS = BoundingBox(CENTER, Window(0.55, 0.35))
+MAPPER = Mapper(BOUNDS, WidthOf(1.8))
+DEGREE = Degree(1, 1)
+BATCHES: int = 20
+PAUSE: float = 0.05  # Seconds between two batches of events.
+
+
+def drained(queue: Queue) -> int:
+    n_items = 0
+    while True:
+        try:
+            _ = queue.get(timeout=0.5)
+        except Empty:
+            return n_items
+        n_items += 1
+
+
+def test_leader_publishes_while_follower_queue_is_full():
+    assert FOLLOWER_OVERLOAD is not Overload.BLOCK
+    publication = Publication(DEGREE, MAPPER)
+    pipe_out, pipe_in = Pipe(duplex=False)
+    leader_queue = Queue()
+    follower_queue = Queue(maxsize=1)
+    follower_queue.put(None)  # Full, and nobody ever drains it.
+    fan_out = [(follower_queue, FOLLOWER_OVERLOAD)]
+    params = DataGateParams(DEGREE, MAPPER, pipe_out, leader_queue,
+                            publication, fan_out)
+    datagate = DataGate(params, overload=Overload.BLOCK)
+    datagate.start()
+    try:
+        received = 0
+        for batch in range(BATCHES):
+            pipe_in.send([Event(uuid4(), Action.ADD, CENTER)])
+            sleep(PAUSE)
+            while True:
+                try:
+                    _ = leader_queue.get_nowait()
+                except Empty:
+                    break
+                received += 1
+        received += drained(leader_queue)
+        assert received == BATCHES
+        assert datagate.N == BATCHES
+        assert datagate.shed['snapshots'] > 0
+    finally:
+        datagate.flag.stop.set()
+        datagate.flag.done.wait(5.0)
+        datagate.join(5.0)
+        publication.unlink()
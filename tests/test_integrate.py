@@ -0,0 +1,60 @@
+import pytest
+from numpy import array, linspace, meshgrid, trapezoid, allclose
+from numpy.random import default_rng
+from lpde.geometry import WidthOf, Window, PointAt, BoundingBox, Mapper
+from lpde.estimators import ParallelEstimator
+from lpde.estimators.datatypes import Degree
+from lpde.producers import MockParams
+from lpde.producers.distributions import gaussian
+
+BOUNDS = BoundingBox(PointAt(51.375, 35.675), Window(0.55, 0.35))
+MAPPER = Mapper(BOUNDS, WidthOf(1.8))
+DEGREE = Degree(12, 9)
+N: int = 321
+RESOLUTION: int = 1501  # Grid points per side of the summation grid.
+BOXES = (BoundingBox(PointAt(51.3, 35.7), Window(0.1, 0.05)),
+         BoundingBox(PointAt(51.45, 35.62), Window(0.04, 0.12)),
+         BOUNDS,
+         BoundingBox(PointAt(51.6, 35.8), Window(0.3, 0.3)),  # Over the edge.
+         BoundingBox(PointAt(51.1, 35.5), Window(0.1, 0.2)))  # Over a corner.
+OUTSIDE = BoundingBox(PointAt(60.0, 60.0), Window(1.0, 1.0))
+
+
+@pytest.fixture(scope='module')
+def estimator():
+    params = MockParams(200, 100000, gaussian)
+    estimator = ParallelEstimator(DEGREE, MAPPER, params)
+    coeffs = default_rng(1).normal(size=(DEGREE.k_max+1)*(DEGREE.l_max+1))
+    estimator.controller.publication.publish(coeffs / (coeffs @ coeffs)**0.5,
+                                             N)
+    yield estimator
+    estimator.controller.stop()
+
+
+def summed_over(estimator, box: BoundingBox) -> float:
+    x_lower = max(box.x_range[0], BOUNDS.x_range[0])
+    x_upper = min(box.x_range[1], BOUNDS.x_range[1])
+    y_lower = max(box.y_range[0], BOUNDS.y_range[0])
+    y_upper = min(box.y_range[1], BOUNDS.y_range[1])
+    x_line = linspace(x_lower, x_upper, RESOLUTION)
+    y_line = linspace(y_lower, y_upper, RESOLUTION)
+    x_grid, y_grid = meshgrid(x_line, y_line)
+    xy = array([x_grid.ravel(), y_grid.ravel()]).T
+    density = estimator.at_many(xy).data.reshape(x_grid.shape)
+    return trapezoid(trapezoid(density, x_line, axis=1), y_line)
+
+
+@pytest.mark.parametrize('box', BOXES)
+def test_integrate_matches_grid_summation(estimator, box):
+    assert estimator.integrate(box) == pytest.approx(
+        summed_over(estimator, box), rel=1e-5)
+
+
+def test_integrate_outside_domain_is_zero(estimator):
+    assert estimator.integrate(OUTSIDE) == 0.0
+
+
+def test_integrate_many_matches_integrate(estimator):
+    boxes = BOXES + (OUTSIDE,)
+    integrals = estimator.integrate_many(array([box.extent for box in boxes]))
+    assert allclose(integrals, [estimator.integrate(box) for box in boxes])
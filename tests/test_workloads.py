@@ -0,0 +1,31 @@
+import pytest
+from numpy import linspace, allclose, ptp
+import lpde.estimators  # Producers import estimators; load those first.
+from lpde.producers.workloads import Hotspots
+
+PERIOD: float = 10.0
+MOMENTS = linspace(0.0, PERIOD, 41)
+
+
+def test_single_hotspot_weight_varies_over_one_period():
+    hotspots = Hotspots([(0.1, -0.1)], period=PERIOD, background=0.1)
+    spot = [hotspots._weights_at(moment)[0] for moment in MOMENTS]
+    assert ptp(spot) == pytest.approx(0.9)
+    assert spot[0] == pytest.approx(spot[-1])
+
+
+def test_hotspot_weights_form_a_distribution():
+    for centers in ([(0.0, 0.0)], [(-0.3, -0.3), (0.3, 0.3), (0.0, 0.4)]):
+        hotspots = Hotspots(centers, period=PERIOD, background=0.2)
+        for moment in MOMENTS:
+            weights = hotspots._weights_at(moment)
+            assert (weights >= 0.0).all()
+            assert allclose(weights.sum(), 1.0)
+            assert weights[-1] >= 0.2 - 1e-12
+
+
+def test_several_hotspots_keep_their_total_mass():
+    hotspots = Hotspots([(-0.3, -0.3), (0.3, 0.3), (0.0, 0.4)],
+                        period=PERIOD, background=0.2)
+    totals = [hotspots._weights_at(moment)[:-1].sum() for moment in MOMENTS]
+    assert allclose(totals, totals[0])